@@ -31,7 +31,7 @@ class Config:
     tts_rate: str = "+0%"
 
     # 처리 설정
-    max_workers: int = 2
+    max_workers: int = 2  # 동시에 더빙할 영상 수 (1이면 한 번에 하나씩 처리)
 
     # UI 설정
     theme: str = "purple-night"
@@ -0,0 +1,134 @@
+"""작업 목록 저장소 (SQLite)
+
+작업 하나가 바뀔 때마다 전체 목록을 JSON으로 다시 쓰는 대신
+작업 단위 행(row)으로 INSERT/UPDATE 합니다.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+
+DATA_DIR = Path.home() / ".dubbing_app"
+JOBS_DB = DATA_DIR / "jobs.db"
+LEGACY_JOBS_FILE = DATA_DIR / "jobs.json"  # 이전 버전 저장 형식 (마이그레이션용)
+PERSISTED_MESSAGES = 100  # 저장할 진행 메시지 수 (최근 것만)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    data TEXT NOT NULL,
+    status TEXT NOT NULL,
+    created_at REAL,
+    updated_at REAL NOT NULL
+)
+"""
+
+_UPSERT = (
+    "INSERT OR REPLACE INTO jobs(job_id, data, status, created_at, updated_at) "
+    "VALUES (?, ?, ?, ?, ?)"
+)
+
+
+def _row(job: dict) -> tuple:
+    """작업 dict를 DB 행으로 변환 (진행 메시지는 최근 PERSISTED_MESSAGES개만 저장)"""
+    data = {**job, "messages": list(job.get("messages", []))[-PERSISTED_MESSAGES:]}
+    return (
+        job["job_id"],
+        json.dumps(data, ensure_ascii=False, default=str),
+        job.get("status", "pending"),
+        _created_at_epoch(job.get("created_at")),
+        time.time(),
+    )
+
+
+_conn: sqlite3.Connection | None = None
+_lock = threading.Lock()
+
+
+def _connect() -> sqlite3.Connection:
+    """DB 연결 (최초 1회 생성 후 재사용)"""
+    global _conn
+    if _conn is None:
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(JOBS_DB, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+        conn.commit()
+        _conn = conn
+        _migrate_legacy_file(conn)
+    return _conn
+
+
+def _created_at_epoch(value) -> float:
+    """created_at을 epoch 초로 변환 (이전 버전의 ISO 문자열 호환)"""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value).timestamp()
+        except ValueError:
+            return 0.0
+    return value or 0.0
+
+
+def _migrate_legacy_file(conn: sqlite3.Connection) -> None:
+    """기존 jobs.json이 있으면 DB로 옮기고 백업 파일로 이름 변경"""
+    if not LEGACY_JOBS_FILE.exists():
+        return
+    try:
+        jobs = json.loads(LEGACY_JOBS_FILE.read_bytes())
+        with conn:
+            conn.executemany(_UPSERT, [_row(job) for job in jobs])
+        LEGACY_JOBS_FILE.rename(LEGACY_JOBS_FILE.with_suffix(".json.bak"))
+    except Exception:
+        pass
+
+
+def load_jobs() -> list[dict]:
+    """저장된 작업 목록 로드 (중단된 작업 복구 포함)"""
+    jobs = []
+    try:
+        with _lock:
+            # fetchall() 대신 커서를 순회해 원본 문자열 전체를 메모리에 올리지 않음
+            for (data,) in _connect().execute("SELECT data FROM jobs ORDER BY created_at"):
+                try:
+                    job = json.loads(data)
+                except json.JSONDecodeError:
+                    continue
+                job["created_at"] = _created_at_epoch(job.get("created_at"))
+                if job.get("status") == "running":
+                    job["status"] = "pending"
+                    job["current_step"] = "중단됨 - 재시작 대기"
+                    job["progress"] = 0
+                jobs.append(job)
+    except Exception:
+        return []
+    return jobs
+
+
+def save_job(job: dict) -> None:
+    """작업 하나 저장 (INSERT OR REPLACE)"""
+    try:
+        with _lock:
+            conn = _connect()
+            with conn:
+                conn.execute(_UPSERT, _row(job))
+    except Exception:
+        pass
+
+
+def save_jobs(jobs: list[dict], deleted_ids: list[str] | None = None) -> None:
+    """여러 작업 저장 + 삭제를 한 트랜잭션으로 처리"""
+    if not jobs and not deleted_ids:
+        return
+    try:
+        with _lock:
+            conn = _connect()
+            with conn:
+                conn.executemany(_UPSERT, [_row(job) for job in jobs])
+                conn.executemany("DELETE FROM jobs WHERE job_id = ?", [(job_id,) for job_id in deleted_ids or []])
+    except Exception:
+        pass
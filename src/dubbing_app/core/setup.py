@@ -1,5 +1,6 @@
 """온보딩 및 자동 설정 모듈"""
 
+import json
 import subprocess
 import sys
 import os
@@ -155,6 +156,19 @@ def start_ollama_server() -> tuple[bool, str]:
         return False, f"서버 시작 실패: {e}"
 
 
+def _iter_ndjson(response: httpx.Response):
+    """NDJSON 스트림을 bytes 줄 단위로 반환 (텍스트 디코딩 없이 받은 청크를 한 번에 분리)"""
+    buffer = b""
+    for chunk in response.iter_bytes():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            if line.strip():
+                yield line
+    if buffer.strip():
+        yield buffer
+
+
 def pull_model(model_name: str, on_progress=None) -> tuple[bool, str]:
     """모델 다운로드 (HTTP API 사용 - 샌드박스 호환)"""
     try:
@@ -169,21 +183,22 @@ def pull_model(model_name: str, on_progress=None) -> tuple[bool, str]:
                 return False, f"API 오류: {response.status_code}"
 
             last_status = ""
-            for line in response.iter_lines():
-                if not line:
-                    continue
+            last_message = None
+            for line in _iter_ndjson(response):
                 try:
-                    import json
                     data = json.loads(line)
                     status = data.get("status", "")
 
-                    # 진행 상황 콜백
+                    # 진행 상황 콜백 (같은 메시지가 연속되면 생략 - 퍼센트가 바뀔 때만 호출)
                     if on_progress:
                         if "completed" in data and "total" in data:
                             pct = int(data["completed"] / data["total"] * 100)
-                            on_progress(f"{status} {pct}%")
+                            message = f"{status} {pct}%"
                         else:
-                            on_progress(status)
+                            message = status
+                        if message != last_message:
+                            on_progress(message)
+                            last_message = message
 
                     last_status = status
 
@@ -1,12 +1,13 @@
 """테마/스킨 시스템"""
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Optional
 
 import flet as ft
 
 
-@dataclass
+@dataclass(frozen=True)
 class AppTheme:
     """앱 테마 정의"""
 
@@ -147,8 +148,9 @@ THEMES: dict[str, AppTheme] = {
 DEFAULT_THEME = "purple-night"
 
 
+@lru_cache(maxsize=None)
 def get_theme(name: str) -> AppTheme:
-    """테마 가져오기"""
+    """테마 가져오기 (THEMES는 불변이므로 조회 결과 캐시)"""
     return THEMES.get(name, THEMES[DEFAULT_THEME])
 
 
@@ -181,27 +183,32 @@ def apply_theme(page: ft.Page, theme: AppTheme) -> None:
     page.update()
 
 
+# 상태 -> 색상 필드 이름 (AppTheme 속성)
+_STATUS_COLOR_FIELDS = {
+    "pending": "text_muted",
+    "running": "info",
+    "paused": "warning",
+    "completed": "success",
+    "error": "error",
+    "cancelled": "text_muted",
+}
+
+# 상태 -> Material 아이콘 이름
+_STATUS_ICONS = {
+    "pending": "hourglass_empty",
+    "running": "sync",
+    "paused": "pause_circle",
+    "completed": "check_circle",
+    "error": "error",
+    "cancelled": "cancel",
+}
+
+
 def get_status_color(theme: AppTheme, status: str) -> str:
     """상태에 따른 색상 반환"""
-    colors = {
-        "pending": theme.text_muted,
-        "running": theme.info,
-        "paused": theme.warning,
-        "completed": theme.success,
-        "error": theme.error,
-        "cancelled": theme.text_muted,
-    }
-    return colors.get(status, theme.text_muted)
+    return getattr(theme, _STATUS_COLOR_FIELDS.get(status, "text_muted"))
 
 
 def get_status_icon(status: str) -> str:
     """상태에 따른 아이콘 반환"""
-    icons = {
-        "pending": "hourglass_empty",
-        "running": "sync",
-        "paused": "pause_circle",
-        "completed": "check_circle",
-        "error": "error",
-        "cancelled": "cancel",
-    }
-    return icons.get(status, "help")
+    return _STATUS_ICONS.get(status, "help")
@@ -1,7 +1,9 @@
 """YouTube 자막 추출 모듈"""
 
+import os
 import re
 import tempfile
+from functools import lru_cache
 from pathlib import Path
 
 import yt_dlp
@@ -203,10 +205,13 @@ def _format_time(seconds: float) -> str:
     return f"{hours:02d}:{minutes:02d}:{secs:06.3f}"
 
 
+@lru_cache(maxsize=512)
 def get_video_info(url: str) -> dict:
     """
     YouTube 영상 정보 가져오기 (자막 언어 정보 포함)
 
+    같은 URL은 캐시된 결과를 반환하므로 반환된 dict를 수정하지 마세요.
+
     Returns:
         dict: {
             "title": str,
@@ -312,10 +317,17 @@ def _get_language_label(lang_code: str) -> str:
     return LANGUAGE_LABELS.get(lang_code, lang_code.upper())
 
 
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE = re.compile(r"\s+")
+_VIDEO_ID_PATTERN = re.compile(
+    r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/v/)([a-zA-Z0-9_-]{11})"
+)
+
+
 def sanitize_filename(title: str) -> str:
     """파일명에 사용할 수 없는 문자 제거"""
-    title = re.sub(r'[<>:"/\\|?*]', "", title)
-    title = re.sub(r"\s+", " ", title).strip()
+    title = _INVALID_FILENAME_CHARS.sub("", title)
+    title = _WHITESPACE.sub(" ", title).strip()
     if len(title) > 50:
         title = title[:50]
     return title
@@ -331,14 +343,9 @@ def extract_video_id(url: str) -> str | None:
     - https://www.youtube.com/embed/VIDEO_ID
     - https://www.youtube.com/v/VIDEO_ID
     """
-    patterns = [
-        r"(?:youtube\.com/watch\?v=|youtu\.be/|youtube\.com/embed/|youtube\.com/v/)([a-zA-Z0-9_-]{11})",
-    ]
-
-    for pattern in patterns:
-        match = re.search(pattern, url)
-        if match:
-            return match.group(1)
+    match = _VIDEO_ID_PATTERN.search(url)
+    if match:
+        return match.group(1)
 
     return None
 
@@ -353,6 +360,7 @@ def check_existing_output(output_dir: Path, video_id: str) -> dict | None:
             "has_audio": bool,
             "has_korean": bool,
             "has_original": bool,
+            "has_segments": bool,  # segments.json 존재 여부
             "is_complete": bool,
             "resume_from": str,  # "start", "translate", "tts", "done"
             "original_text": str | None,
@@ -362,42 +370,52 @@ def check_existing_output(output_dir: Path, video_id: str) -> dict | None:
         또는 None (폴더 없음)
     """
     # video_id로 시작하는 폴더 찾기
-    if not output_dir.exists():
+    try:
+        with os.scandir(output_dir) as entries:
+            folder_entry = next(
+                (entry for entry in entries if entry.name.startswith(video_id) and entry.is_dir()),
+                None,
+            )
+    except OSError:
+        return None
+    if folder_entry is None:
         return None
 
-    for folder in output_dir.iterdir():
-        if folder.is_dir() and folder.name.startswith(video_id):
-            # MP3 파일 찾기 (제목.mp3 또는 audio_korean.mp3)
-            mp3_files = list(folder.glob("*.mp3"))
-            audio_file = mp3_files[0] if mp3_files else None
-
-            korean_file = folder / "transcript_korean.txt"
-            original_file = folder / "transcript_original.txt"
-
-            has_audio = audio_file is not None
-            has_korean = korean_file.exists()
-            has_original = original_file.exists()
-
-            # 재개 지점 결정
-            if has_audio and has_korean:
-                resume_from = "done"
-            elif has_korean:
-                resume_from = "tts"
-            elif has_original:
-                resume_from = "translate"
-            else:
-                resume_from = "start"
+    # 폴더를 한 번만 읽고 파일 존재 여부는 이름 집합으로 판단 (파일마다 stat 하지 않음)
+    folder = Path(folder_entry.path)
+    with os.scandir(folder) as entries:
+        names = {entry.name for entry in entries if entry.is_file()}
 
-            return {
-                "folder": folder,
-                "has_audio": has_audio,
-                "has_korean": has_korean,
-                "has_original": has_original,
-                "is_complete": has_audio and has_korean,
-                "resume_from": resume_from,
-                "original_text": original_file.read_text(encoding="utf-8") if has_original else None,
-                "korean_text": korean_file.read_text(encoding="utf-8") if has_korean else None,
-                "audio_file": audio_file,
-            }
+    # MP3 파일 찾기 (제목.mp3 또는 audio_korean.mp3)
+    mp3_name = next((name for name in names if name.endswith(".mp3")), None)
+    audio_file = folder / mp3_name if mp3_name else None
 
-    return None
+    korean_file = folder / "transcript_korean.txt"
+    original_file = folder / "transcript_original.txt"
+
+    has_audio = audio_file is not None
+    has_korean = korean_file.name in names
+    has_original = original_file.name in names
+
+    # 재개 지점 결정
+    if has_audio and has_korean:
+        resume_from = "done"
+    elif has_korean:
+        resume_from = "tts"
+    elif has_original:
+        resume_from = "translate"
+    else:
+        resume_from = "start"
+
+    return {
+        "folder": folder,
+        "has_audio": has_audio,
+        "has_korean": has_korean,
+        "has_original": has_original,
+        "has_segments": "segments.json" in names,
+        "is_complete": has_audio and has_korean,
+        "resume_from": resume_from,
+        "original_text": original_file.read_text(encoding="utf-8") if has_original else None,
+        "korean_text": korean_file.read_text(encoding="utf-8") if has_korean else None,
+        "audio_file": audio_file,
+    }
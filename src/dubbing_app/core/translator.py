@@ -1,7 +1,15 @@
 """z.ai GLM 번역 모듈 (OpenAI 호환)"""
 
+import atexit
+import json
 import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
 import httpx
 from openai import OpenAI
 
@@ -65,6 +73,7 @@ YouTube 자동 자막은 다음 문제가 있습니다:
 }
 
 
+@lru_cache(maxsize=32)
 def get_translation_prompt(
     style: str = "natural",
     tone: str = "lecture",
@@ -82,6 +91,8 @@ def get_translation_prompt(
 
     Returns:
         str: 시스템 프롬프트
+
+    청크마다 호출되지만 인자 조합이 몇 개뿐이므로 만든 프롬프트를 캐시해 재사용합니다.
     """
     if style not in TRANSLATION_PROMPTS:
         style = "natural"
@@ -234,8 +245,6 @@ def remove_fillers(text: str) -> str:
     Returns:
         정제된 텍스트
     """
-    import re
-
     # 영어 필러
     fillers = [
         r'\b(um|uh|er|ah|like|you know|I mean|so|well|basically|actually|literally)\b',
@@ -255,9 +264,15 @@ def remove_fillers(text: str) -> str:
     return result
 
 
+OLLAMA_STATUS_TTL = 30.0  # 정상 응답을 재사용할 시간 (초)
+
+# ollama_url -> (확인 시각(monotonic), 결과). 실패 결과는 캐시하지 않음 (서버를 띄우면 바로 반영)
+_ollama_status_cache: dict[str, tuple[float, dict]] = {}
+
+
 def check_ollama_status(base_url: str = "http://localhost:11434") -> dict:
     """
-    Ollama 서버 상태 확인
+    Ollama 서버 상태 확인 (정상 응답은 OLLAMA_STATUS_TTL 동안 캐시)
 
     Returns:
         dict: {
@@ -269,16 +284,22 @@ def check_ollama_status(base_url: str = "http://localhost:11434") -> dict:
     # base_url에서 /v1 제거
     ollama_url = base_url.replace("/v1", "")
 
+    cached = _ollama_status_cache.get(ollama_url)
+    if cached is not None and time.monotonic() - cached[0] < OLLAMA_STATUS_TTL:
+        return cached[1]
+
     try:
         # 모델 목록 조회
         response = httpx.get(f"{ollama_url}/api/tags", timeout=5.0)
         if response.status_code == 200:
             data = response.json()
             models = [m["name"] for m in data.get("models", [])]
-            return {
+            result = {
                 "available": True,
                 "models": models,
             }
+            _ollama_status_cache[ollama_url] = (time.monotonic(), result)
+            return result
         else:
             return {
                 "available": False,
@@ -318,14 +339,18 @@ def check_model_loaded(
             "error": str (실패 시)
         }
     """
+    # 모델명 정규화 (gemma3:latest -> gemma3)
+    model_base = model.split(":")[0]
+
     status = check_ollama_status(base_url)
+    if status["available"] and not any(name.startswith(model_base) for name in status["models"]):
+        # 캐시된 목록에 없으면 방금 pull 했을 수 있으므로 캐시를 버리고 한 번 더 조회
+        _ollama_status_cache.pop(base_url.replace("/v1", ""), None)
+        status = check_ollama_status(base_url)
 
     if not status["available"]:
         return {"loaded": False, "error": status.get("error")}
 
-    # 모델명 정규화 (gemma3:latest -> gemma3)
-    model_base = model.split(":")[0]
-
     for available_model in status["models"]:
         if available_model.startswith(model_base):
             return {"loaded": True}
@@ -628,6 +653,80 @@ def translate_segments(
     }
 
 
+_pools: dict[int, ThreadPoolExecutor] = {}  # 동시 번역 수 -> 스레드 풀
+_pool_lock = threading.Lock()
+
+
+def _get_pool(max_workers: int) -> ThreadPoolExecutor:
+    """
+    번역용 스레드 풀 (동시 번역 수별로 하나씩 만들어 작업 간에 공유)
+
+    여러 더빙 작업이 동시에 실행될 수 있으므로 실행 중에는 풀을 닫지 않음.
+    같은 풀을 쓰는 작업들은 max_workers개의 번역 요청 한도를 함께 나눠 씀.
+    """
+    with _pool_lock:
+        pool = _pools.get(max_workers)
+        if pool is None:
+            pool = _pools[max_workers] = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="translate"
+            )
+        return pool
+
+
+def _shutdown_pool() -> None:
+    """종료 시 대기 중인 번역 취소"""
+    for pool in _pools.values():
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+atexit.register(_shutdown_pool)
+
+
+def _translate_in_pool(
+    translate_fn: Callable[[Any], dict],
+    items: list[tuple[int, Any]],
+    results: list,
+    max_parallel: int,
+    on_done: Callable[[int, Any], None] | None = None,
+) -> dict | None:
+    """
+    청크를 공유 번역 풀에서 병렬 번역해 results[index]에 저장 (완료 순서와 무관하게 순서 유지)
+
+    Args:
+        translate_fn: 청크 하나를 번역하는 함수 (translate_text와 같은 결과 dict 반환)
+        items: (결과 인덱스, translate_fn 인자) 목록
+        results: 번역 결과를 저장할 목록
+        max_parallel: 동시 번역 수
+        on_done: 청크 하나가 끝날 때마다 호출 (결과 인덱스, 인자)
+
+    Returns:
+        실패한 청크의 결과 dict (모두 성공하면 None)
+    """
+    futures = {}
+    if items:
+        executor = _get_pool(max_parallel)
+        futures = {executor.submit(translate_fn, arg): (index, arg) for index, arg in items}
+
+    for future in as_completed(futures):
+        try:
+            result = future.result()
+        except Exception as e:
+            result = {"success": False, "error": str(e)}
+
+        if not result["success"]:
+            # 나머지 작업 취소 (공유 풀이므로 다른 작업의 번역에는 영향 없음)
+            for f in futures:
+                f.cancel()
+            return result
+
+        index, arg = futures[future]
+        results[index] = result["translated"]
+        if on_done:
+            on_done(index, arg)
+
+    return None
+
+
 def translate_by_segments(
     segments: list[dict],
     api_key: str,
@@ -662,10 +761,6 @@ def translate_by_segments(
             "error": str (실패 시)
         }
     """
-    import json
-    from pathlib import Path
-    from concurrent.futures import ThreadPoolExecutor, as_completed
-
     if not segments:
         return {"success": True, "translated": ""}
 
@@ -743,7 +838,6 @@ def translate_by_segments(
 
     # 병렬 번역
     completed = already_completed
-    error_result = None
 
     def translate_and_save(chunk: dict) -> dict:
         """청크 번역 후 파일 저장"""
@@ -764,38 +858,20 @@ def translate_by_segments(
 
         return result
 
-    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
-        futures = {}
-        for chunk in chunk_data:
-            future = executor.submit(translate_and_save, chunk)
-            futures[future] = chunk
-
-        for future in as_completed(futures):
-            chunk = futures[future]
-            idx = chunk["index"]
-
-            try:
-                result = future.result()
-
-                if not result["success"]:
-                    error_result = result
-                    # 나머지 작업 취소
-                    for f in futures:
-                        f.cancel()
-                    break
-
-                results[idx] = result["translated"]
-                completed += 1
-
-                print(f"[번역] 청크 {idx+1}/{total} 완료 ({chunk['start']}~)", file=sys.stderr)
-
-                if on_progress:
-                    on_progress(completed, total)
-
-            except Exception as e:
-                error_result = {"success": False, "error": str(e)}
-                break
-
+    def on_chunk_done(idx: int, chunk: dict):
+        nonlocal completed
+        completed += 1
+        print(f"[번역] 청크 {idx+1}/{total} 완료 ({chunk['start']}~)", file=sys.stderr)
+        if on_progress:
+            on_progress(completed, total)
+
+    error_result = _translate_in_pool(
+        translate_and_save,
+        [(chunk["index"], chunk) for chunk in chunk_data],
+        results,
+        max_parallel,
+        on_chunk_done,
+    )
     if error_result:
         return error_result
 
@@ -821,6 +897,7 @@ def translate_full_text(
     chunks_dir: str | None = None,  # 청크 저장 디렉토리
     translation_style: str = "natural",
     translation_tone: str = "lecture",
+    max_parallel: int = 3,  # 동시 번역 수
 ) -> dict:
     """
     긴 텍스트를 청크 단위로 번역
@@ -834,6 +911,7 @@ def translate_full_text(
         on_progress: 진행 콜백 (current, total)
         segments: 자막 세그먼트 (있으면 시간 기반 번역)
         chunks_dir: 청크 저장 디렉토리 (재개 지원)
+        max_parallel: 동시 번역 수 (기본 3)
 
     Returns:
         dict: {
@@ -853,11 +931,9 @@ def translate_full_text(
             chunks_dir=chunks_dir,
             translation_style=translation_style,
             translation_tone=translation_tone,
+            max_parallel=max_parallel,
         )
 
-    import json
-    from pathlib import Path
-
     # 짧은 텍스트는 바로 번역
     if len(text) <= chunk_size:
         return translate_text(
@@ -885,12 +961,12 @@ def translate_full_text(
         }
         meta_file.write_text(json.dumps(meta_data, ensure_ascii=False, indent=2))
 
-    # 기존 완료 청크 확인 + 번역
+    # 기존 완료 청크 확인
     translated_chunks = [None] * total
     already_completed = 0
+    pending = []
 
-    for i, chunk in enumerate(chunks):
-        # 기존 완료 청크 확인
+    for i in range(total):
         if chunks_path:
             chunk_file = chunks_path / f"chunk_{i:03d}.txt"
             if chunk_file.exists():
@@ -898,26 +974,42 @@ def translate_full_text(
                 already_completed += 1
                 print(f"[번역] 청크 {i+1}/{total} 이미 완료 (스킵)", file=sys.stderr)
                 continue
+        pending.append(i)
 
+    def translate_and_save(i: int) -> dict:
+        """청크 번역 후 파일 저장"""
         print(f"[번역] 청크 {i+1}/{total} 번역 중...", file=sys.stderr)
         result = translate_text(
-            chunk, api_key, base_url, model,
+            chunks[i], api_key, base_url, model,
             translation_style=translation_style,
             translation_tone=translation_tone,
         )
 
-        if not result["success"]:
-            return result
-
-        translated_chunks[i] = result["translated"]
-
-        # 청크 파일 저장
-        if chunks_path:
+        # 성공 시 파일 저장
+        if result["success"] and chunks_path:
             chunk_file = chunks_path / f"chunk_{i:03d}.txt"
             chunk_file.write_text(result["translated"], encoding="utf-8")
 
+        return result
+
+    # 병렬 번역 (결과는 인덱스 위치에 저장하므로 순서 유지)
+    completed = already_completed
+
+    def on_chunk_done(*_):
+        nonlocal completed
+        completed += 1
         if on_progress:
-            on_progress(i + 1, total)
+            on_progress(completed, total)
+
+    error_result = _translate_in_pool(
+        translate_and_save,
+        [(i, i) for i in pending],
+        translated_chunks,
+        max_parallel,
+        on_chunk_done,
+    )
+    if error_result:
+        return error_result
 
     if already_completed > 0:
         print(f"[번역] {already_completed}개 청크 재사용, {total - already_completed}개 번역 완료", file=sys.stderr)
@@ -937,8 +1029,6 @@ def _split_into_chunks(text: str, max_size: int) -> list[str]:
     2. 문장 종결 부호 (. ! ? 등)
     3. 쉼표, 세미콜론 등
     """
-    import re
-
     # 1단계: 줄바꿈 기준으로 먼저 분할
     lines = [line.strip() for line in text.split('\n') if line.strip()]
 
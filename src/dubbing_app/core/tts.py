@@ -1,6 +1,7 @@
 """edge-tts 음성 생성 모듈"""
 
 import asyncio
+import os
 from pathlib import Path
 
 import edge_tts
@@ -15,10 +16,35 @@ KOREAN_VOICES = {
 DEFAULT_VOICE = "ko-KR-SunHiNeural"
 
 
-async def _generate_tts_async(text: str, output_path: str, voice: str, rate: str) -> None:
-    """비동기 TTS 생성"""
-    communicate = edge_tts.Communicate(text, voice, rate=rate)
-    await communicate.save(output_path)
+async def _generate_tts_async(
+    chunks: list[str],
+    output_path: str,
+    voice: str,
+    rate: str,
+    on_progress: callable = None,
+) -> None:
+    """
+    비동기 TTS 생성
+
+    청크별 오디오를 받는 즉시 하나의 파일에 이어 씀 (청크별 임시 MP3 + 병합 단계 없음).
+    MP3는 단순 바이너리 연결로 병합 가능 (같은 설정일 때).
+    완료 전까지는 .part 파일에 쓰고 마지막에 교체하므로 중간 실패 시 불완전한 파일이 남지 않음.
+    """
+    part_path = f"{output_path}.part"
+    try:
+        with open(part_path, "wb") as outfile:
+            for i, chunk in enumerate(chunks):
+                if on_progress and len(chunks) > 1:
+                    on_progress(f"청크 {i+1}/{len(chunks)} 변환 중...")
+
+                communicate = edge_tts.Communicate(chunk, voice, rate=rate)
+                async for message in communicate.stream():
+                    if message["type"] == "audio":
+                        outfile.write(message["data"])
+        os.replace(part_path, output_path)
+    except BaseException:
+        Path(part_path).unlink(missing_ok=True)
+        raise
 
 
 def generate_tts(
@@ -55,52 +81,25 @@ def generate_tts(
         max_chunk_size = 5000  # edge-tts 제한
 
         if len(text) <= max_chunk_size:
+            chunks = [text]
             if on_progress:
                 on_progress(f"변환 중... (길이: {len(text)}자)")
-
-            asyncio.run(_generate_tts_async(text, output_path, voice, rate))
-
-            if on_progress:
-                on_progress(f"완료: {output_path}")
-
-            return {
-                "success": True,
-                "path": output_path,
-            }
         else:
             # 청크로 나누어 처리
             chunks = _split_text_into_chunks(text, max_chunk_size)
-
             if on_progress:
                 on_progress(f"총 {len(chunks)}개 청크로 분할됨")
 
-            temp_files = []
-            for i, chunk in enumerate(chunks):
-                temp_path = f"{output_path}.part{i}.mp3"
-
-                if on_progress:
-                    on_progress(f"청크 {i+1}/{len(chunks)} 변환 중...")
-
-                asyncio.run(_generate_tts_async(chunk, temp_path, voice, rate))
-                temp_files.append(temp_path)
-
-            # 병합
-            if on_progress:
-                on_progress("파일 병합 중...")
-
-            _merge_audio_files(temp_files, output_path)
+        # 모든 청크를 한 번의 이벤트 루프에서 처리
+        asyncio.run(_generate_tts_async(chunks, output_path, voice, rate, on_progress))
 
-            # 임시 파일 삭제
-            for f in temp_files:
-                Path(f).unlink(missing_ok=True)
+        if on_progress:
+            on_progress(f"완료: {output_path}")
 
-            if on_progress:
-                on_progress(f"완료: {output_path}")
-
-            return {
-                "success": True,
-                "path": output_path,
-            }
+        return {
+            "success": True,
+            "path": output_path,
+        }
 
     except Exception as e:
         return {
@@ -131,15 +130,6 @@ def _split_text_into_chunks(text: str, max_size: int) -> list[str]:
     return chunks
 
 
-def _merge_audio_files(input_files: list[str], output_path: str) -> None:
-    """MP3 파일들을 병합 (순수 Python - 바이너리 concat)"""
-    # MP3는 단순 바이너리 연결로 병합 가능 (같은 설정일 때)
-    with open(output_path, "wb") as outfile:
-        for input_file in input_files:
-            with open(input_file, "rb") as infile:
-                outfile.write(infile.read())
-
-
 async def list_voices() -> list[dict]:
     """사용 가능한 한국어 음성 목록"""
     voices = await edge_tts.list_voices()
@@ -1,12 +1,22 @@
 """YouTube Dubbing App - FluentFlet UI with Async Job Queue"""
 
+# 성능 메모: 이 모듈의 비용은 Flet IPC, subprocess, httpx 호출이 대부분이다.
+# 최적화는 이벤트 루프 블로킹 제거(asyncio.to_thread), 위젯 할당 감소(증분 갱신),
+# I/O 배치에 집중한다. 수치 연산 루프가 없으므로 Numba/Cython 같은 JIT은 대상이 아니다.
+
 import asyncio
-import json
+import atexit
+import os
 import subprocess
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import asdict
-from datetime import datetime
 from importlib.metadata import version, PackageNotFoundError
 from pathlib import Path
+from queue import Empty, SimpleQueue
+from typing import Callable, ClassVar
 
 # 버전 정보 (pyproject.toml에서 자동 로드)
 try:
@@ -18,9 +28,10 @@ import flet as ft
 import flet_audio
 
 from dubbing_app.core.config import Config, load_config, save_config
+from dubbing_app.core.job_store import load_jobs, save_job, save_jobs
 from dubbing_app.core.theme import THEMES, get_theme, apply_theme, get_status_color, AppTheme
 from dubbing_app.core.tts import KOREAN_VOICES
-from dubbing_app.core.transcript import get_video_info
+from dubbing_app.core.transcript import extract_video_id, get_video_info
 from dubbing_app.core.setup import (
     is_ollama_installed, is_ollama_running, has_model,
     install_ollama_macos, start_ollama_server, pull_model,
@@ -45,32 +56,29 @@ def styled_button(
     icon: str = None,
 ) -> ft.ElevatedButton:
     """테마 적용된 스타일 버튼"""
-    if theme and primary:
-        return ft.ElevatedButton(
-            text=text,
-            icon=icon,
-            on_click=on_click,
-            bgcolor=theme.accent,
-            color=theme.text_primary,
-            style=ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=8),
-                padding=ft.padding.symmetric(horizontal=20, vertical=12),
-            ),
+    button = ft.ElevatedButton(text=text, icon=icon, on_click=on_click)
+    if theme:
+        theme_button(button, theme, primary)
+    return button
+
+
+def theme_button(button: ft.ElevatedButton, theme: AppTheme, primary: bool = False) -> None:
+    """버튼에 테마 색상 적용 (테마 변경 시 기존 버튼에 다시 적용 가능)"""
+    if primary:
+        button.bgcolor = theme.accent
+        button.color = theme.text_primary
+        button.style = ft.ButtonStyle(
+            shape=ft.RoundedRectangleBorder(radius=8),
+            padding=ft.padding.symmetric(horizontal=20, vertical=12),
         )
-    elif theme:
-        return ft.ElevatedButton(
-            text=text,
-            icon=icon,
-            on_click=on_click,
-            bgcolor=theme.surface,
-            color=theme.text_primary,
-            style=ft.ButtonStyle(
-                shape=ft.RoundedRectangleBorder(radius=8),
-                padding=ft.padding.symmetric(horizontal=16, vertical=10),
-                side=ft.BorderSide(1, theme.border),
-            ),
+    else:
+        button.bgcolor = theme.surface
+        button.color = theme.text_primary
+        button.style = ft.ButtonStyle(
+            shape=ft.RoundedRectangleBorder(radius=8),
+            padding=ft.padding.symmetric(horizontal=16, vertical=10),
+            side=ft.BorderSide(1, theme.border),
         )
-    return ft.ElevatedButton(text=text, icon=icon, on_click=on_click)
 
 
 def styled_textfield(
@@ -98,7 +106,22 @@ def styled_textfield(
 
 
 # 상수
-JOBS_FILE = Path.home() / ".dubbing_app" / "jobs.json"
+REFRESH_INTERVAL = 0.1  # 목록 갱신 요청을 모으는 간격 (초)
+SAVE_INTERVAL = 1.0  # 작업 저장 요청을 모으는 간격 (초)
+MAX_JOB_MESSAGES = 200  # 작업별로 메모리에 유지할 진행 메시지 수
+ACTIVE_STATUSES = ("pending", "running")  # 같은 URL을 중복 추가할 수 없는 상태
+PENDING_TAB_STATUSES = frozenset(("pending", "running", "paused", "error"))  # 진행중 탭에 표시할 상태
+
+# 작업 상태별 카드 아이콘
+STATUS_ICONS = {
+    "pending": ft.Icons.HOURGLASS_EMPTY,
+    "running": ft.Icons.SYNC,
+    "paused": ft.Icons.PAUSE_CIRCLE,
+    "completed": ft.Icons.CHECK_CIRCLE,
+    "error": ft.Icons.ERROR,
+    "cancelled": ft.Icons.CANCEL,
+}
+
 PRESETS = {
     "z.ai": {
         "base_url": "https://api.z.ai/api/coding/paas/v4",
@@ -113,6 +136,22 @@ PRESETS = {
 }
 
 
+def open_external(target: str) -> None:
+    """파일/폴더/URL을 OS 기본 앱으로 열기 (실행 완료를 기다리지 않음)"""
+    try:
+        if sys.platform == "win32":
+            os.startfile(target)
+        else:
+            opener = "open" if sys.platform == "darwin" else "xdg-open"
+            subprocess.Popen(
+                [opener, target],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+    except Exception:
+        pass
+
+
 def get_ollama_models() -> list[str]:
     """Ollama 설치된 모델 목록 가져오기"""
     try:
@@ -173,121 +212,231 @@ def check_ai_config(config: Config) -> tuple[bool, str]:
         return True, f"API 준비됨 ({config.zai_model})"
 
 
-def load_jobs() -> list[dict]:
-    """저장된 작업 목록 로드 (중단된 작업 복구 포함)"""
-    try:
-        if JOBS_FILE.exists():
-            jobs = json.loads(JOBS_FILE.read_text())
-            for job in jobs:
-                if job.get("status") == "running":
-                    job["status"] = "pending"
-                    job["current_step"] = "중단됨 - 재시작 대기"
-                    job["progress"] = 0
-            return jobs
-    except Exception:
-        pass
-    return []
+class JobCard(ft.Container):
+    """개별 작업 카드 컴포넌트 (FluentFlet 스타일)
 
+    한 번 생성한 뒤에는 update_from()으로 바뀐 필드만 갱신합니다.
+    콜백과 재생 상태는 앱(DubbingApp)에서 필요할 때 읽습니다.
+    """
 
-def save_jobs(jobs: list[dict]):
-    """작업 목록 저장"""
-    try:
-        JOBS_FILE.parent.mkdir(parents=True, exist_ok=True)
-        JOBS_FILE.write_text(json.dumps(jobs, ensure_ascii=False, indent=2, default=str))
-    except Exception:
-        pass
+    def __init__(self, job: dict, app: "DubbingApp"):
+        self.job = job
+        self.app = app
+        # Container.theme(Flet 테마)와 겹치지 않도록 별도 이름 사용
+        # 테마가 바뀌면 앱에서 카드를 새로 생성함
+        self.app_theme = theme = app.theme
+        self._hover_state = False
+
+        # 마지막으로 반영한 상태 (변경 감지용)
+        self._video_info = None
+        self._state_keys: dict[str, tuple] = {}
+
+        # 작업 상태에 따라 바뀌는 컨트롤들 (update_from에서 갱신)
+        self.thumbnail_widget = ft.Container(
+            on_click=lambda e: self.open_url(self.job.get("url", "")),
+            tooltip="YouTube에서 보기",
+            animate=ft.Animation(200, ft.AnimationCurve.EASE_OUT),
+        )
+        self.status_icon = ft.Icon(size=16)
+        self.title_text = ft.Text(
+            size=14,
+            weight=ft.FontWeight.W_600,
+            color=theme.text_primary,
+            overflow=ft.TextOverflow.ELLIPSIS,
+            max_lines=1,
+        )
+        self.title_container = ft.Container(
+            content=self.title_text,
+            expand=True,
+            on_click=lambda e: self.open_url(self.job.get("url", "")),
+        )
+        self.actions_row = ft.Row(spacing=0)
+        self.meta_row = ft.Row(spacing=10)
+        self.description_text = ft.Text(
+            size=11,
+            color=theme.text_muted,
+            max_lines=1,
+            overflow=ft.TextOverflow.ELLIPSIS,
+        )
+        self.progress_bar = ft.ProgressBar(expand=True, bgcolor=theme.border)
+        self.progress_text = ft.Text(size=11, color=theme.text_secondary, width=35)
+        self.step_text = ft.Text(size=11, color=theme.text_muted, max_lines=1)
 
+        self.update_from(job)
 
-class JobCard(ft.Container):
-    """개별 작업 카드 컴포넌트 (FluentFlet 스타일)"""
-
-    def __init__(
-        self,
-        job: dict,
-        theme: AppTheme,
-        on_delete,
-        on_retry,
-        on_start_single=None,
-        page=None,
-        on_play=None,
-        on_pause=None,
-        on_resume=None,
-        on_cancel=None,
-        playing_audio_path: str | None = None,
-        is_audio_playing: bool = False,
-        on_lang_change=None,
-    ):
-        self.job = job
-        self.theme = theme
-        self.on_delete = on_delete
-        self.on_retry = on_retry
-        self.on_start_single = on_start_single
-        self.on_play = on_play
-        self.on_pause = on_pause
-        self.on_resume = on_resume
-        self.on_cancel = on_cancel
-        self.page = page
-        self.playing_audio_path = playing_audio_path
-        self.is_audio_playing = is_audio_playing
-        self.on_lang_change = on_lang_change
+        super().__init__(
+            content=ft.Row(
+                [
+                    # 썸네일
+                    self.thumbnail_widget,
+                    # 영상 정보 + 진행 상태
+                    ft.Column(
+                        [
+                            # 제목 + 상태 아이콘 + 액션
+                            ft.Row(
+                                [
+                                    self.status_icon,
+                                    self.title_container,
+                                    self.actions_row,
+                                ],
+                                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                                vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                            ),
+                            # 채널 + 재생시간 + 자막 언어
+                            self.meta_row,
+                            # 설명 (1줄)
+                            self.description_text,
+                            # 진행률
+                            ft.Row(
+                                [
+                                    self.progress_bar,
+                                    self.progress_text,
+                                ],
+                                spacing=8,
+                            ),
+                            # 현재 단계
+                            self.step_text,
+                        ],
+                        spacing=4,
+                        expand=True,
+                    ),
+                ],
+                spacing=16,
+                vertical_alignment=ft.CrossAxisAlignment.START,
+            ),
+            padding=16,
+            border_radius=12,
+            bgcolor=theme.card_bg,
+            border=ft.border.all(1, theme.border),
+            margin=ft.margin.only(bottom=10),
+            animate=ft.Animation(200, ft.AnimationCurve.EASE_OUT),
+            on_hover=lambda e: self._on_hover(e),
+        )
+
+    def _changed(self, key: str, value: tuple) -> bool:
+        """key의 상태가 마지막 반영값과 다르면 저장 후 True"""
+        if self._state_keys.get(key) == value:
+            return False
+        self._state_keys[key] = value
+        return True
+
+    def update_from(self, job: dict) -> list[ft.Control]:
+        """
+        작업 상태를 카드에 반영 (바뀐 부분만)
 
+        Returns:
+            값이 바뀐 자식 컨트롤 목록 (호출 측에서 update() 호출)
+        """
+        self.job = job
+        app = self.app
+        theme = self.app_theme
         status = job["status"]
         status_color = get_status_color(theme, status)
+        video_info = job.get("video_info", {})
+        changed = []
 
-        # 상태 아이콘
-        status_icons = {
-            "pending": ft.Icons.HOURGLASS_EMPTY,
-            "running": ft.Icons.SYNC,
-            "paused": ft.Icons.PAUSE_CIRCLE,
-            "completed": ft.Icons.CHECK_CIRCLE,
-            "error": ft.Icons.ERROR,
-            "cancelled": ft.Icons.CANCEL,
-        }
-        status_icon = status_icons.get(status, ft.Icons.HELP)
+        # 영상 정보 (썸네일, 제목, 설명)
+        info_changed = video_info is not self._video_info
+        if info_changed:
+            self._video_info = video_info
+            self._apply_video_info(video_info)
+            changed += [self.thumbnail_widget, self.title_container, self.description_text]
 
-        # 영상 정보
-        video_info = job.get("video_info", {})
+        # 상태 아이콘
+        if self._changed("status", (status,)):
+            self.status_icon.name = STATUS_ICONS.get(status, ft.Icons.HELP)
+            self.status_icon.color = status_color
+            changed.append(self.status_icon)
+
+        # 액션 버튼
+        audio_file = None
+        if status == "completed":
+            result_files = job.get("result_files", [])
+            audio_file = next((f for f in result_files if f.endswith(".mp3")), None)
+        is_this_playing = (
+            audio_file is not None
+            and app.current_audio_path == audio_file
+            and app.is_playing
+        )
+        if self._changed("actions", (status, audio_file, is_this_playing, job.get("output_dir", ""))):
+            self.actions_row.controls = self._build_actions(job, audio_file, is_this_playing)
+            changed.append(self.actions_row)
+
+        # 채널 + 재생시간 + 자막 언어
+        if self._changed("meta", (status, job.get("source_lang", "en"))) or info_changed:
+            self.meta_row.controls = self._build_meta_controls(job, status)
+            changed.append(self.meta_row)
+
+        # 진행률
+        progress = job.get("progress", 0)
+        if self._changed("progress", (progress, status)):
+            self.progress_bar.value = progress / 100
+            self.progress_bar.color = theme.accent if status == "running" else status_color
+            self.progress_text.value = f"{progress}%"
+            changed += [self.progress_bar, self.progress_text]
+
+        # 현재 단계
+        step = job.get("current_step", "") or status
+        if self._changed("step", (step,)):
+            self.step_text.value = step
+            changed.append(self.step_text)
+
+        return changed
+
+    def _apply_video_info(self, video_info: dict):
+        """영상 정보(썸네일, 제목, 설명) 반영"""
+        theme = self.app_theme
         title = video_info.get("title", "제목 로딩 중...")
-        uploader = video_info.get("uploader", "")
         thumbnail = video_info.get("thumbnail", "")
-        duration = video_info.get("duration", 0)
         description = video_info.get("description", "")
-        url = job.get("url", "")
 
-        # 재생시간 포맷
-        duration_str = ""
-        if duration:
-            mins, secs = divmod(duration, 60)
-            hours, mins = divmod(mins, 60)
-            if hours:
-                duration_str = f"{hours}:{mins:02d}:{secs:02d}"
-            else:
-                duration_str = f"{mins}:{secs:02d}"
-
-        # 진행률 바
-        progress_bar = ft.ProgressBar(
-            value=job.get("progress", 0) / 100,
-            expand=True,
-            color=theme.accent if status == "running" else status_color,
-            bgcolor=theme.border,
+        # 썸네일 (클릭 시 YouTube로 이동)
+        self.thumbnail_widget.content = (
+            ft.Image(
+                src=thumbnail,
+                width=140,
+                height=79,
+                fit=ft.ImageFit.COVER,
+                border_radius=ft.border_radius.all(8),
+            )
+            if thumbnail
+            else ft.Container(
+                width=140,
+                height=79,
+                bgcolor=theme.surface,
+                border_radius=8,
+                content=ft.Icon(ft.Icons.VIDEO_LIBRARY, color=theme.text_muted, size=32),
+                alignment=ft.alignment.center,
+            )
         )
 
-        current_step = job.get("current_step", "")
+        # 제목 텍스트
+        self.title_text.value = title[:50] + "..." if len(title) > 50 else title
+        self.title_container.tooltip = title
+
+        # 설명 (1줄)
+        self.description_text.value = (
+            description[:100] + "..." if len(description) > 100 else description
+        )
+        self.description_text.visible = bool(description)
 
-        # 액션 버튼들
+    def _build_actions(self, job: dict, audio_file: str | None, is_this_playing: bool) -> list[ft.Control]:
+        """상태별 액션 버튼 생성"""
+        theme = self.app_theme
+        status = job["status"]
         actions = []
 
-        if job["status"] == "pending":
+        if status == "pending":
             actions.append(
                 ft.IconButton(
                     icon=ft.Icons.PLAY_ARROW_ROUNDED,
                     tooltip="시작",
                     icon_color=theme.success,
                     icon_size=20,
-                    on_click=lambda e: on_start_single(job) if on_start_single else None,
+                    on_click=lambda e: self.app.start_single_job(self.job),
                 )
             )
-        elif job["status"] == "running":
+        elif status == "running":
             # 실행 중: 일시 정지 버튼
             actions.append(
                 ft.IconButton(
@@ -295,10 +444,10 @@ class JobCard(ft.Container):
                     tooltip="일시 정지",
                     icon_color=theme.warning,
                     icon_size=20,
-                    on_click=lambda e: on_pause(job) if on_pause else None,
+                    on_click=lambda e: self.app.pause_job(self.job),
                 )
             )
-        elif job["status"] == "paused":
+        elif status == "paused":
             # 일시 정지 중: 재개, 취소 버튼
             actions.append(
                 ft.IconButton(
@@ -306,7 +455,7 @@ class JobCard(ft.Container):
                     tooltip="재개",
                     icon_color=theme.success,
                     icon_size=20,
-                    on_click=lambda e: on_resume(job) if on_resume else None,
+                    on_click=lambda e: self.app.resume_job(self.job),
                 )
             )
             actions.append(
@@ -315,25 +464,18 @@ class JobCard(ft.Container):
                     tooltip="취소",
                     icon_color=theme.error,
                     icon_size=20,
-                    on_click=lambda e: on_cancel(job) if on_cancel else None,
+                    on_click=lambda e: self.app.cancel_job(self.job),
                 )
             )
-        elif job["status"] == "completed":
-            result_files = job.get("result_files", [])
-            audio_file = next((f for f in result_files if f.endswith(".mp3")), None)
-
-            if audio_file and on_play:
-                # 현재 이 파일이 재생 중인지 확인
-                is_this_playing = (
-                    self.playing_audio_path == audio_file and self.is_audio_playing
-                )
+        elif status == "completed":
+            if audio_file:
                 actions.append(
                     ft.IconButton(
                         icon=ft.Icons.PAUSE_CIRCLE_FILLED if is_this_playing else ft.Icons.PLAY_CIRCLE_FILLED,
                         tooltip="일시정지" if is_this_playing else "재생",
                         icon_color=theme.accent,
                         icon_size=22,
-                        on_click=lambda e, f=audio_file: on_play(f),
+                        on_click=lambda e, f=audio_file: self.app.play_audio(f),
                     )
                 )
 
@@ -348,14 +490,14 @@ class JobCard(ft.Container):
                         on_click=lambda e, d=output_dir: self.open_folder(d),
                     )
                 )
-        elif job["status"] == "error":
+        elif status == "error":
             actions.append(
                 ft.IconButton(
                     icon=ft.Icons.REFRESH_ROUNDED,
                     tooltip="재시도",
                     icon_color=theme.warning,
                     icon_size=20,
-                    on_click=lambda e: on_retry(job),
+                    on_click=lambda e: self.app.retry_job(self.job),
                 )
             )
 
@@ -365,163 +507,74 @@ class JobCard(ft.Container):
                 tooltip="삭제",
                 icon_color=theme.text_muted,
                 icon_size=18,
-                on_click=lambda e: on_delete(job),
+                on_click=lambda e: self.app.delete_job(self.job),
             )
         )
+        return actions
 
-        # 썸네일 (클릭 시 YouTube로 이동)
-        thumbnail_widget = ft.Container(
-            content=ft.Image(
-                src=thumbnail,
-                width=140,
-                height=79,
-                fit=ft.ImageFit.COVER,
-                border_radius=ft.border_radius.all(8),
-            )
-            if thumbnail
-            else ft.Container(
-                width=140,
-                height=79,
-                bgcolor=theme.surface,
-                border_radius=8,
-                content=ft.Icon(ft.Icons.VIDEO_LIBRARY, color=theme.text_muted, size=32),
-                alignment=ft.alignment.center,
-            ),
-            on_click=lambda e: self.open_url(url),
-            tooltip="YouTube에서 보기",
-            animate=ft.Animation(200, ft.AnimationCurve.EASE_OUT),
-        )
+    def _build_meta_controls(self, job: dict, status: str) -> list[ft.Control]:
+        """채널명, 재생시간, 자막 언어 컨트롤 생성"""
+        theme = self.app_theme
+        video_info = job.get("video_info", {})
+        uploader = video_info.get("uploader", "")
+        duration = video_info.get("duration", 0)
 
-        # 제목 텍스트
-        title_text = ft.Text(
-            title[:50] + "..." if len(title) > 50 else title,
-            size=14,
-            weight=ft.FontWeight.W_600,
-            color=theme.text_primary,
-            overflow=ft.TextOverflow.ELLIPSIS,
-            max_lines=1,
-        )
+        # 재생시간 포맷
+        duration_str = ""
+        if duration:
+            mins, secs = divmod(duration, 60)
+            hours, mins = divmod(mins, 60)
+            if hours:
+                duration_str = f"{hours}:{mins:02d}:{secs:02d}"
+            else:
+                duration_str = f"{mins}:{secs:02d}"
 
-        super().__init__(
-            content=ft.Row(
-                [
-                    # 썸네일
-                    thumbnail_widget,
-                    # 영상 정보 + 진행 상태
-                    ft.Column(
-                        [
-                            # 제목 + 상태 아이콘 + 액션
-                            ft.Row(
-                                [
-                                    ft.Icon(status_icon, size=16, color=status_color),
-                                    ft.Container(
-                                        content=title_text,
-                                        expand=True,
-                                        on_click=lambda e: self.open_url(url),
-                                        tooltip=title,
-                                    ),
-                                    ft.Row(actions, spacing=0),
-                                ],
-                                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-                                vertical_alignment=ft.CrossAxisAlignment.CENTER,
-                            ),
-                            # 채널 + 재생시간 + 자막 언어
-                            ft.Row(
-                                [
-                                    ft.Text(
-                                        uploader,
-                                        size=11,
-                                        color=theme.text_secondary,
-                                    )
-                                    if uploader
-                                    else ft.Container(),
-                                    ft.Container(
-                                        content=ft.Text(
-                                            duration_str,
-                                            size=10,
-                                            color=theme.text_muted,
-                                        ),
-                                        bgcolor=theme.surface,
-                                        padding=ft.padding.symmetric(horizontal=6, vertical=2),
-                                        border_radius=4,
-                                    )
-                                    if duration_str
-                                    else ft.Container(),
-                                    self._build_subtitle_dropdown(job, theme, status),
-                                ],
-                                spacing=10,
-                            ),
-                            # 설명 (1줄)
-                            ft.Text(
-                                description[:100] + "..." if len(description) > 100 else description,
-                                size=11,
-                                color=theme.text_muted,
-                                max_lines=1,
-                                overflow=ft.TextOverflow.ELLIPSIS,
-                            )
-                            if description
-                            else ft.Container(),
-                            # 진행률
-                            ft.Row(
-                                [
-                                    progress_bar,
-                                    ft.Text(
-                                        f"{job.get('progress', 0)}%",
-                                        size=11,
-                                        color=theme.text_secondary,
-                                        width=35,
-                                    ),
-                                ],
-                                spacing=8,
-                            ),
-                            # 현재 단계
-                            ft.Text(
-                                current_step or status,
-                                size=11,
-                                color=theme.text_muted,
-                                max_lines=1,
-                            ),
-                        ],
-                        spacing=4,
-                        expand=True,
-                    ),
-                ],
-                spacing=16,
-                vertical_alignment=ft.CrossAxisAlignment.START,
-            ),
-            padding=16,
-            border_radius=12,
-            bgcolor=theme.card_bg,
-            border=ft.border.all(1, theme.border),
-            margin=ft.margin.only(bottom=10),
-            animate=ft.Animation(200, ft.AnimationCurve.EASE_OUT),
-            on_hover=lambda e: self._on_hover(e),
-        )
+        return [
+            ft.Text(
+                uploader,
+                size=11,
+                color=theme.text_secondary,
+            )
+            if uploader
+            else ft.Container(),
+            ft.Container(
+                content=ft.Text(
+                    duration_str,
+                    size=10,
+                    color=theme.text_muted,
+                ),
+                bgcolor=theme.surface,
+                padding=ft.padding.symmetric(horizontal=6, vertical=2),
+                border_radius=4,
+            )
+            if duration_str
+            else ft.Container(),
+            self._build_subtitle_dropdown(job, theme, status),
+        ]
 
     def _on_hover(self, e):
         """호버 효과"""
-        if not self.theme:
+        if not self.app_theme:
+            return
+        hovered = e.data == "true"
+        # 같은 상태의 중복 이벤트는 무시 (불필요한 update 방지)
+        if hovered == self._hover_state:
             return
+        self._hover_state = hovered
         try:
-            if e.data == "true":
-                self.border = ft.border.all(1, self.theme.accent)
+            if hovered:
+                self.border = ft.border.all(1, self.app_theme.accent)
             else:
-                self.border = ft.border.all(1, self.theme.border)
+                self.border = ft.border.all(1, self.app_theme.border)
             self.update()
         except Exception:
             pass
 
     def open_folder(self, path: str):
-        try:
-            subprocess.run(["open", path])
-        except Exception:
-            pass
+        open_external(path)
 
     def open_url(self, url: str):
-        try:
-            subprocess.run(["open", url])
-        except Exception:
-            pass
+        open_external(url)
 
     def _build_subtitle_dropdown(self, job: dict, theme: AppTheme, status: str):
         """자막 언어 드롭다운 생성 (pending 상태일 때만)"""
@@ -555,8 +608,7 @@ class JobCard(ft.Container):
         # pending 상태: 드롭다운 표시
         def on_change(e):
             job["source_lang"] = e.control.value
-            if self.on_lang_change:
-                self.on_lang_change(job)
+            self.app.change_subtitle_lang(job)
 
         return ft.Container(
             content=ft.Row(
@@ -587,36 +639,75 @@ class JobCard(ft.Container):
 class DubbingApp:
     """메인 앱 클래스"""
 
+    # Toast 심각도 -> 배경색 테마 필드
+    TOAST_COLOR_FIELDS: ClassVar[dict[str, str]] = {
+        ToastSeverity.INFORMATIONAL: "info",
+        ToastSeverity.SUCCESS: "success",
+        ToastSeverity.WARNING: "warning",
+        ToastSeverity.CRITICAL: "error",
+    }
+
     def __init__(self, page: ft.Page):
         self.page = page
         self.config = load_config()
         self.theme = get_theme(self.config.theme)
-        self.jobs: list[dict] = load_jobs()
+        self.jobs: dict[str, dict] = {j["job_id"]: j for j in load_jobs()}  # job_id -> 작업
+        for job in self.jobs.values():
+            job["messages"] = deque(job.get("messages", []), maxlen=MAX_JOB_MESSAGES)
+        self._status_counts: Counter[str] = Counter(j["status"] for j in self.jobs.values())
+        # URL -> 대기/실행 중인 작업 수 (중복 추가 검사용)
+        self._active_urls: Counter[str] = Counter(
+            j["url"] for j in self.jobs.values() if j["status"] in ACTIVE_STATUSES
+        )
         self.ollama_models: list[str] = []
         self.job_queue: asyncio.Queue = asyncio.Queue()
-        self.worker_running = False
+        self._worker_count = 0  # 실행 중인 작업 워커 수 (최대 config.max_workers)
         self.current_audio = None
         self.current_audio_path: str | None = None
         self.is_playing = False
         self.pause_controllers: dict[str, PauseController] = {}  # job_id -> PauseController
+        self._progress_queues: dict[str, SimpleQueue] = {}  # job_id -> 실행 중 작업의 진행 메시지 큐
+        self._job_cards: dict[str, JobCard] = {}  # job_id -> JobCard (목록 갱신 시 재사용)
+        self._theme_dlg: tuple[ft.AlertDialog, dict[str, tuple]] | None = None  # 재사용하는 테마 다이얼로그
+        self._settings_dlg: tuple[ft.AlertDialog, Callable[[], None]] | None = None  # 재사용하는 설정 다이얼로그
+        self._theme_generation = 0  # 테마 변경 순번 (이전 테마로 만든 카드 폐기용)
+        self._info_futures: dict[str, Future] = {}  # url -> 입력란 URL의 미리 가져오기 (최대 1개)
+
+        # 목록 갱신/저장 요청 병합 (각각 REFRESH_INTERVAL, SAVE_INTERVAL마다 최대 1회 처리)
+        self._loop = asyncio.get_running_loop()
+        self._dirty = asyncio.Event()
+        self._refresh_immediate = False
+        self._save_dirty = asyncio.Event()
+        self._save_immediate = False
+        self._unsaved_jobs: dict[str, dict | None] = {}  # job_id -> 저장 대기 작업 (None이면 삭제)
+        self._flush_lock = asyncio.Lock()  # 저장/삭제가 요청 순서대로 DB에 반영되도록 한 번에 하나씩 기록
+
+        # 더빙/영상 정보 조회용 스레드 풀 (처음 쓸 때 생성, 세션 종료 시 정리)
+        self.executor: ThreadPoolExecutor | None = None
 
         self.setup_page()
         self.build_ui()
-        self.check_ai_on_startup()
+        self.page.run_task(self._refresh_loop)
+        self.page.run_task(self._save_loop)
+        self.page.on_disconnect = self.shutdown
+        self.page.run_task(self.check_ai_on_startup)
 
-    def check_ai_on_startup(self):
+    async def check_ai_on_startup(self):
         """앱 시작 시 AI 설정 상태 확인 + Ollama 온보딩"""
+        # 상태 확인은 HTTP 요청/ollama CLI 실행이므로 스레드에서 수행 (첫 화면 표시를 막지 않음)
         # Ollama 사용 설정인 경우 온보딩 체크
         if self.config.ai_engine == "ollama":
-            self.check_ollama_onboarding()
+            status = await asyncio.to_thread(check_setup_status)
+            self.check_ollama_onboarding(status)
         else:
-            ok, msg = check_ai_config(self.config)
+            ok, msg = await asyncio.to_thread(check_ai_config, self.config)
             if not ok:
                 self.show_config_warning(msg)
 
-    def check_ollama_onboarding(self):
-        """Ollama 온보딩 체크"""
-        status = check_setup_status()
+    def check_ollama_onboarding(self, status: dict | None = None):
+        """Ollama 온보딩 체크 (status가 없으면 직접 확인)"""
+        if status is None:
+            status = check_setup_status()
 
         # 1. Ollama 미설치
         if not status["ollama_installed"]:
@@ -960,7 +1051,7 @@ class DubbingApp:
             on_state_changed=lambda e: self._on_audio_state_changed(e),
         )
         self.page.overlay.append(self.current_audio)
-        self.page.update()
+        self.page.update()  # overlay 구성 변경은 페이지 단위로만 반영 가능
         self.is_playing = True
 
         filename = Path(audio_path).stem
@@ -999,23 +1090,49 @@ class DubbingApp:
 
     def build_ui(self):
         """UI 구성"""
-        theme = self.theme
+        # 테마 변경 시 컨트롤을 다시 만들지 않고 색상만 바꾸도록 적용 함수를 등록
+        self._theme_consumers: list[Callable[[AppTheme], None]] = []
+        themed = self._themed
 
         # URL 입력
         self.url_input = styled_textfield(
             placeholder="YouTube URL을 입력하세요...",
             width=420,
-            theme=theme,
             on_submit=lambda e: self.add_job(e),
+            on_blur=self._prefetch_video_info,
         )
 
+        def theme_url_input(t: AppTheme):
+            field = self.url_input
+            field.border_color = t.border
+            field.focused_border_color = t.accent
+            field.cursor_color = t.accent
+            field.text_style = ft.TextStyle(color=t.text_primary)
+            field.hint_style = ft.TextStyle(color=t.text_muted)
+            field.bgcolor = t.surface
+
+        self._on_theme(theme_url_input)
+
+        def button(text: str, on_click, primary: bool = False) -> ft.ElevatedButton:
+            btn = styled_button(text, on_click=on_click)
+            self._on_theme(lambda t: theme_button(btn, t, primary))
+            return btn
+
+        def theme_dropdown(dropdown: ft.Dropdown):
+            def apply(t: AppTheme):
+                dropdown.border_color = t.border
+                dropdown.focused_border_color = t.accent
+                dropdown.text_style = ft.TextStyle(color=t.text_primary, size=12)
+
+            self._on_theme(apply)
+
         # 번역 스타일 라디오 버튼
         self.style_radio = ft.RadioGroup(
             value=self.config.translation_style,
             content=ft.Row(
                 [
-                    ft.Radio(value="faithful", label="원문 충실", fill_color=theme.accent),
-                    ft.Radio(value="natural", label="자연스러운 더빙", fill_color=theme.accent),
+                    themed(ft.Radio(value="faithful", label="원문 충실"), fill_color="accent"),
+                    themed(ft.Radio(value="natural", label="자연스러운 더빙"), fill_color="accent"),
                 ],
                 spacing=8,
             ),
@@ -1031,13 +1148,11 @@ class DubbingApp:
                 ft.dropdown.Option("casual", "대화체"),
                 ft.dropdown.Option("formal", "뉴스체"),
             ],
-            border_color=theme.border,
-            focused_border_color=theme.accent,
-            text_style=ft.TextStyle(color=theme.text_primary, size=12),
             content_padding=ft.padding.symmetric(horizontal=10, vertical=8),
             disabled=self.config.translation_style != "natural",
             on_change=self._on_tone_change,
         )
+        theme_dropdown(self.tone_dropdown)
 
         # 기본 자막 언어 드롭다운 (새 작업 추가 시 기본값으로 사용)
         self.subtitle_lang_dropdown = ft.Dropdown(
@@ -1052,26 +1167,31 @@ class DubbingApp:
                 ft.dropdown.Option("fr", "Français"),
                 ft.dropdown.Option("de", "Deutsch"),
             ],
-            border_color=theme.border,
-            focused_border_color=theme.accent,
-            text_style=ft.TextStyle(color=theme.text_primary, size=12),
             content_padding=ft.padding.symmetric(horizontal=10, vertical=8),
             dense=True,
             on_change=self._on_subtitle_lang_change,
         )
+        theme_dropdown(self.subtitle_lang_dropdown)
 
-        # 진행중 탭 - 작업 목록
-        self.pending_list = ft.Column(
+        # 목록 컨트롤을 새로 만들므로 카드를 다시 배치하도록 초기화
+        self._last_pending_ids: list[str] | None = None
+        self._last_completed_ids: list[str] | None = None
+        self._last_fingerprint: tuple | None = None
+
+        # 진행중 탭 - 작업 목록 (ListView: 화면에 보이는 카드만 빌드)
+        self.pending_list = ft.ListView(
             spacing=0,
-            scroll=ft.ScrollMode.AUTO,
+            padding=0,
             expand=True,
+            build_controls_on_demand=True,
         )
 
-        # 완료됨 탭 - 재생 목록
-        self.completed_list = ft.Column(
+        # 완료됨 탭 - 재생 목록 (ListView: 화면에 보이는 카드만 빌드)
+        self.completed_list = ft.ListView(
             spacing=0,
-            scroll=ft.ScrollMode.AUTO,
+            padding=0,
             expand=True,
+            build_controls_on_demand=True,
         )
 
         # 상태 표시
@@ -1079,18 +1199,14 @@ class DubbingApp:
         mode_icon = "assets/ollama.png" if is_ollama else "assets/zai.png"
         mode_text = f"Ollama ({self.config.zai_model})" if is_ollama else f"z.ai ({self.config.zai_model})"
 
-        self.status_text = ft.Text(mode_text, size=12, color=theme.text_muted)
+        self.status_text = themed(ft.Text(mode_text, size=12), color="text_muted")
 
         # 탭 구성
         self.tabs = ft.Tabs(
             selected_index=0,
             animation_duration=200,
             expand=True,
-            label_color=theme.primary,
-            unselected_label_color=theme.text_muted,
-            indicator_color=theme.accent,
             indicator_border_radius=4,
-            divider_color=theme.divider,
             tabs=[
                 ft.Tab(
                     text="진행중",
@@ -1100,22 +1216,19 @@ class DubbingApp:
                             [
                                 ft.Row(
                                     [
-                                        styled_button(
-                                            "전체 시작",
-                                            primary=True,
-                                            theme=theme,
-                                            on_click=self.on_start_all_click,
-                                        ),
+                                        button("전체 시작", self.on_start_all_click, primary=True),
                                     ],
                                     alignment=ft.MainAxisAlignment.END,
                                 ),
                                 ft.Container(height=8),
-                                ft.Container(
-                                    content=self.pending_list,
-                                    expand=True,
-                                    border_radius=12,
-                                    padding=12,
-                                    bgcolor=theme.surface,
+                                themed(
+                                    ft.Container(
+                                        content=self.pending_list,
+                                        expand=True,
+                                        border_radius=12,
+                                        padding=12,
+                                    ),
+                                    bgcolor="surface",
                                 ),
                             ],
                             expand=True,
@@ -1132,21 +1245,19 @@ class DubbingApp:
                             [
                                 ft.Row(
                                     [
-                                        styled_button(
-                                            "전체 삭제",
-                                            theme=theme,
-                                            on_click=self.clear_completed,
-                                        ),
+                                        button("전체 삭제", self.clear_completed),
                                     ],
                                     alignment=ft.MainAxisAlignment.END,
                                 ),
                                 ft.Container(height=8),
-                                ft.Container(
-                                    content=self.completed_list,
-                                    expand=True,
-                                    border_radius=12,
-                                    padding=12,
-                                    bgcolor=theme.surface,
+                                themed(
+                                    ft.Container(
+                                        content=self.completed_list,
+                                        expand=True,
+                                        border_radius=12,
+                                        padding=12,
+                                    ),
+                                    bgcolor="surface",
                                 ),
                             ],
                             expand=True,
@@ -1157,6 +1268,13 @@ class DubbingApp:
                 ),
             ],
         )
+        themed(
+            self.tabs,
+            label_color="primary",
+            unselected_label_color="text_muted",
+            indicator_color="accent",
+            divider_color="divider",
+        )
 
         # 헤더
         header = ft.Container(
@@ -1164,12 +1282,10 @@ class DubbingApp:
                 [
                     ft.Row(
                         [
-                            ft.Icon(ft.Icons.MOVIE_FILTER_ROUNDED, size=28, color=theme.primary),
-                            ft.Text(
-                                "YouTube Dubbing",
-                                size=22,
-                                weight=ft.FontWeight.BOLD,
-                                color=theme.text_primary,
+                            themed(ft.Icon(ft.Icons.MOVIE_FILTER_ROUNDED, size=28), color="primary"),
+                            themed(
+                                ft.Text("YouTube Dubbing", size=22, weight=ft.FontWeight.BOLD),
+                                color="text_primary",
                             ),
                         ],
                         spacing=10,
@@ -1177,23 +1293,29 @@ class DubbingApp:
                     ft.Row(
                         [
                             self.status_text,
-                            ft.IconButton(
-                                icon=ft.Icons.PALETTE_ROUNDED,
-                                tooltip="테마",
-                                icon_color=theme.text_secondary,
-                                on_click=self.show_theme_picker,
+                            themed(
+                                ft.IconButton(
+                                    icon=ft.Icons.PALETTE_ROUNDED,
+                                    tooltip="테마",
+                                    on_click=self.show_theme_picker,
+                                ),
+                                icon_color="text_secondary",
                             ),
-                            ft.IconButton(
-                                icon=ft.Icons.SETTINGS_ROUNDED,
-                                tooltip="설정",
-                                icon_color=theme.text_secondary,
-                                on_click=self.show_settings,
+                            themed(
+                                ft.IconButton(
+                                    icon=ft.Icons.SETTINGS_ROUNDED,
+                                    tooltip="설정",
+                                    on_click=self.show_settings,
+                                ),
+                                icon_color="text_secondary",
                             ),
-                            ft.IconButton(
-                                icon=ft.Icons.INFO_OUTLINE_ROUNDED,
-                                tooltip="정보",
-                                icon_color=theme.text_secondary,
-                                on_click=self.show_about,
+                            themed(
+                                ft.IconButton(
+                                    icon=ft.Icons.INFO_OUTLINE_ROUNDED,
+                                    tooltip="정보",
+                                    on_click=self.show_about,
+                                ),
+                                icon_color="text_secondary",
                             ),
                         ],
                         spacing=4,
@@ -1202,10 +1324,14 @@ class DubbingApp:
                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
             ),
             padding=ft.padding.symmetric(horizontal=24, vertical=16),
-            bgcolor=theme.surface,
-            border=ft.border.only(bottom=ft.BorderSide(1, theme.divider)),
         )
 
+        def theme_header(t: AppTheme):
+            header.bgcolor = t.surface
+            header.border = ft.border.only(bottom=ft.BorderSide(1, t.divider))
+
+        self._on_theme(theme_header)
+
         # 입력 영역
         input_area = ft.Container(
             content=ft.Column(
@@ -1214,12 +1340,7 @@ class DubbingApp:
                     ft.Row(
                         [
                             self.url_input,
-                            styled_button(
-                                "추가",
-                                primary=True,
-                                theme=theme,
-                                on_click=self.add_job,
-                            ),
+                            button("추가", self.add_job, primary=True),
                         ],
                         spacing=12,
                         alignment=ft.MainAxisAlignment.CENTER,
@@ -1227,13 +1348,13 @@ class DubbingApp:
                     # 번역 옵션
                     ft.Row(
                         [
-                            ft.Text("번역:", size=12, color=theme.text_secondary),
+                            themed(ft.Text("번역:", size=12), color="text_secondary"),
                             self.style_radio,
                             ft.Container(width=12),
-                            ft.Text("톤:", size=12, color=theme.text_secondary),
+                            themed(ft.Text("톤:", size=12), color="text_secondary"),
                             self.tone_dropdown,
                             ft.Container(width=12),
-                            ft.Icon(ft.Icons.LANGUAGE_ROUNDED, size=16, color=theme.text_secondary),
+                            themed(ft.Icon(ft.Icons.LANGUAGE_ROUNDED, size=16), color="text_secondary"),
                             self.subtitle_lang_dropdown,
                         ],
                         spacing=6,
@@ -1245,8 +1366,8 @@ class DubbingApp:
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
             ),
             padding=ft.padding.symmetric(horizontal=24, vertical=16),
-            bgcolor=theme.background,
         )
+        themed(input_area, bgcolor="background")
 
         # 메인 레이아웃
         self.page.add(
@@ -1267,109 +1388,262 @@ class DubbingApp:
 
         self.refresh_jobs_list()
 
+    def _on_theme(self, apply: Callable[[AppTheme], None]) -> None:
+        """테마 적용 함수 등록 (현재 테마로 즉시 적용)"""
+        apply(self.theme)
+        self._theme_consumers.append(apply)
+
+    def _themed(self, control: ft.Control, **fields: str) -> ft.Control:
+        """컨트롤 속성을 테마 필드에 연결 (예: color="text_muted")"""
+
+        def apply(t: AppTheme):
+            for attr, field in fields.items():
+                setattr(control, attr, getattr(t, field))
+
+        self._on_theme(apply)
+        return control
+
     def refresh_jobs_list(self):
-        """작업 목록 UI 갱신"""
-        self.pending_list.controls.clear()
-        self.completed_list.controls.clear()
-
-        pending_jobs = [j for j in self.jobs if j["status"] in ("pending", "running", "paused", "error")]
-        completed_jobs = [j for j in self.jobs if j["status"] == "completed"]
-
-        if self.tabs.tabs:
-            self.tabs.tabs[0].text = f"진행중 ({len(pending_jobs)})"
-            self.tabs.tabs[1].text = f"완료됨 ({len(completed_jobs)})"
-
-        # 진행중 탭
-        if not pending_jobs:
-            self.pending_list.controls.append(
-                ft.Container(
-                    content=ft.Column(
-                        [
-                            ft.Icon(ft.Icons.ADD_CIRCLE_OUTLINE_ROUNDED, size=48, color=self.theme.text_muted),
-                            ft.Text(
-                                "진행 중인 작업이 없습니다",
-                                color=self.theme.text_muted,
-                                size=14,
-                            ),
-                            ft.Text(
-                                "YouTube URL을 입력하고 추가하세요",
-                                color=self.theme.text_muted,
-                                size=12,
-                            ),
-                        ],
-                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                        spacing=8,
-                    ),
-                    alignment=ft.alignment.center,
-                    padding=60,
-                )
-            )
-        else:
-            for job in reversed(pending_jobs):
-                self.pending_list.controls.append(
-                    JobCard(
-                        job,
-                        self.theme,
-                        self.delete_job,
-                        self.retry_job,
-                        self.start_single_job,
-                        self.page,
-                        self.play_audio,
-                        self.pause_job,
-                        self.resume_job,
-                        self.cancel_job,
-                        self.current_audio_path,
-                        self.is_playing,
-                        self.change_subtitle_lang,
-                    )
+        """작업 목록 UI 갱신 요청"""
+        self._request_refresh()
+
+    def _request_refresh(self, job: dict | None = None, immediate: bool = False):
+        """
+        목록 갱신 요청 (스레드 안전)
+
+        Args:
+            job: 변경되어 저장이 필요한 작업
+            immediate: True면 대기 없이 바로 갱신 (완료/오류 등 종료 상태 전환)
+        """
+        self._loop.call_soon_threadsafe(self._mark_dirty, job, immediate)
+
+    def _mark_dirty(self, job: dict | None, immediate: bool):
+        """갱신 필요 표시 (이벤트 루프에서 실행)"""
+        if job is not None:
+            self._drain_progress(job)
+            self._save_jobs_soon(job, immediate)
+        if immediate:
+            self._refresh_immediate = True
+        self._dirty.set()
+
+    def _drain_progress(self, job: dict):
+        """워커 스레드가 쌓아 둔 진행 메시지를 작업에 반영 (이벤트 루프에서 실행)"""
+        queue = self._progress_queues.get(job["job_id"])
+        if queue is None:
+            return
+        messages = job["messages"]
+        while True:
+            try:
+                msg, progress = queue.get_nowait()
+            except Empty:
+                break
+            messages.append(msg)
+            job["current_step"] = msg
+            job["progress"] = progress
+
+    def _save_jobs_soon(self, job: dict, immediate: bool = False):
+        """작업 저장 예약 (이벤트 루프에서 실행, 이미 삭제된 작업은 무시)"""
+        if self.jobs.get(job["job_id"]) is not job:
+            return
+        self._unsaved_jobs[job["job_id"]] = job
+        if immediate:
+            self._save_immediate = True
+        self._save_dirty.set()
+
+    def _delete_jobs_soon(self, job_ids: list[str]):
+        """작업 삭제 예약 (저장 대기열에 삭제 표시를 넣어 먼저 시작된 저장보다 뒤에 반영)"""
+        for job_id in job_ids:
+            self._unsaved_jobs[job_id] = None
+        self._save_immediate = True
+        self._save_dirty.set()
+
+    async def _refresh_loop(self):
+        """갱신 요청을 모아서 목록 갱신을 한 번에 처리"""
+        while True:
+            await self._dirty.wait()
+            if not self._refresh_immediate:
+                await asyncio.sleep(REFRESH_INTERVAL)
+            self._dirty.clear()
+            self._refresh_immediate = False
+
+            try:
+                await self._refresh_jobs_list_async()
+            except Exception:
+                pass
+
+    async def _save_loop(self):
+        """저장 요청을 모아서 한 트랜잭션으로 저장"""
+        while True:
+            await self._save_dirty.wait()
+            if not self._save_immediate:
+                await asyncio.sleep(SAVE_INTERVAL)
+            self._save_dirty.clear()
+            self._save_immediate = False
+            await self._flush_unsaved_jobs()
+
+    async def _flush_unsaved_jobs(self):
+        """저장/삭제 대기 중인 작업을 DB에 기록 (한 트랜잭션)"""
+        async with self._flush_lock:
+            unsaved, self._unsaved_jobs = self._unsaved_jobs, {}
+            # 메시지 deque는 이벤트 루프에서만 바뀌므로 여기서 복사해 스레드로 넘김
+            jobs = [{**job, "messages": list(job["messages"])} for job in unsaved.values() if job is not None]
+            deleted = [job_id for job_id, job in unsaved.items() if job is None]
+            if jobs or deleted:
+                await asyncio.to_thread(save_jobs, jobs, deleted)
+
+    async def _refresh_jobs_list_async(self):
+        """
+        작업 목록 UI 갱신 (증분)
+
+        - 새 작업: JobCard 생성 (워커 스레드에서 수행)
+        - 기존 작업: 바뀐 필드만 JobCard에 반영
+        - 목록 구성(작업 추가/삭제/탭 이동)이 바뀐 경우에만 탭 영역 전체 update()
+        - 화면에 보이는 값이 하나도 바뀌지 않았으면 아무것도 하지 않음
+        """
+        # 작업 수만큼 도는 루프에서 쓰는 속성은 지역 변수로 한 번만 조회
+        jobs = self.jobs.values()
+        job_cards = self._job_cards
+
+        fingerprint = (
+            self.current_audio_path,
+            self.is_playing,
+            tuple(
+                (
+                    j["job_id"],
+                    j["status"],
+                    j.get("progress", 0),
+                    j.get("current_step"),
+                    j.get("source_lang"),
+                    j.get("output_dir"),
+                    len(j.get("result_files", ())),
+                    id(j.get("video_info")),  # video_info는 통째로 교체되므로 객체 identity로 비교
                 )
+                for j in jobs
+            ),
+        )
+        if fingerprint == self._last_fingerprint:
+            return
 
-        # 완료됨 탭
-        if not completed_jobs:
-            self.completed_list.controls.append(
-                ft.Container(
-                    content=ft.Column(
-                        [
-                            ft.Icon(ft.Icons.HEADPHONES_ROUNDED, size=48, color=self.theme.text_muted),
-                            ft.Text(
-                                "완료된 작업이 없습니다",
-                                color=self.theme.text_muted,
-                                size=14,
-                            ),
-                            ft.Text(
-                                "더빙이 완료되면 여기서 재생할 수 있습니다",
-                                color=self.theme.text_muted,
-                                size=12,
-                            ),
-                        ],
-                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                        spacing=8,
-                    ),
-                    alignment=ft.alignment.center,
-                    padding=60,
+        pending_statuses = PENDING_TAB_STATUSES
+        pending_jobs = sorted(
+            (j for j in jobs if j["status"] in pending_statuses),
+            key=lambda j: j["created_at"],
+        )
+        completed_jobs = sorted(
+            (j for j in jobs if j["status"] == "completed"),
+            key=lambda j: j["created_at"],
+        )
+        pending_ids = [j["job_id"] for j in reversed(pending_jobs)]
+        completed_ids = [j["job_id"] for j in reversed(completed_jobs)]
+
+        # 삭제된 작업의 카드 정리
+        live_ids = set(pending_ids) | set(completed_ids)
+        for job_id in [job_id for job_id in job_cards if job_id not in live_ids]:
+            del job_cards[job_id]
+
+        # 기존 카드는 바뀐 필드만 반영
+        changed_controls = []
+        new_jobs = []
+        get_card = job_cards.get
+        for job in pending_jobs + completed_jobs:
+            card = get_card(job["job_id"])
+            if card is None:
+                new_jobs.append(job)
+            else:
+                changed_controls += card.update_from(job)
+
+        # 새 카드 생성: Flet 컨트롤 생성은 순수 Python 객체 할당이므로 이벤트 루프 밖에서 처리
+        if new_jobs:
+            theme_generation = self._theme_generation
+            cards = await asyncio.to_thread(lambda: [JobCard(j, self) for j in new_jobs])
+            # 생성하는 동안 테마가 바뀌었으면 이전 색상 카드이므로 버림 (_apply_theme가 요청한 갱신에서 다시 생성)
+            if theme_generation != self._theme_generation:
+                return
+            for card in cards:
+                job_cards[card.job["job_id"]] = card
+
+        if pending_ids != self._last_pending_ids or completed_ids != self._last_completed_ids:
+            self._last_pending_ids = pending_ids
+            self._last_completed_ids = completed_ids
+
+            if self.tabs.tabs:
+                self.tabs.tabs[0].text = f"진행중 ({len(pending_jobs)})"
+                self.tabs.tabs[1].text = f"완료됨 ({len(completed_jobs)})"
+
+            self.pending_list.controls = [job_cards[i] for i in pending_ids] or [
+                self._build_empty_placeholder(
+                    ft.Icons.ADD_CIRCLE_OUTLINE_ROUNDED,
+                    "진행 중인 작업이 없습니다",
+                    "YouTube URL을 입력하고 추가하세요",
                 )
-            )
-        else:
-            for job in reversed(completed_jobs):
-                self.completed_list.controls.append(
-                    JobCard(
-                        job,
-                        self.theme,
-                        self.delete_job,
-                        self.retry_job,
-                        self.start_single_job,
-                        self.page,
-                        self.play_audio,
-                        self.pause_job,
-                        self.resume_job,
-                        self.cancel_job,
-                        self.current_audio_path,
-                        self.is_playing,
-                        None,  # on_lang_change - 완료된 작업은 언어 변경 불가
-                    )
+            ]
+            self.completed_list.controls = [job_cards[i] for i in completed_ids] or [
+                self._build_empty_placeholder(
+                    ft.Icons.HEADPHONES_ROUNDED,
+                    "완료된 작업이 없습니다",
+                    "더빙이 완료되면 여기서 재생할 수 있습니다",
                 )
+            ]
+            # 바뀐 것은 탭 라벨과 두 목록뿐이므로 페이지 전체 대신 탭 영역만 전송
+            self.tabs.update()
+        else:
+            for control in changed_controls:
+                try:
+                    control.update()
+                except Exception:
+                    pass
 
-        self.page.update()
+        # 화면 반영이 끝난 뒤에 기록 (도중에 예외가 나면 다음 갱신에서 다시 시도)
+        self._last_fingerprint = fingerprint
+
+    def _build_empty_placeholder(self, icon: str, title: str, subtitle: str) -> ft.Container:
+        """빈 목록 안내 컨테이너"""
+        return ft.Container(
+            content=ft.Column(
+                [
+                    ft.Icon(icon, size=48, color=self.theme.text_muted),
+                    ft.Text(
+                        title,
+                        color=self.theme.text_muted,
+                        size=14,
+                    ),
+                    ft.Text(
+                        subtitle,
+                        color=self.theme.text_muted,
+                        size=12,
+                    ),
+                ],
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                spacing=8,
+            ),
+            alignment=ft.alignment.center,
+            padding=60,
+        )
+
+    def _add_job_record(self, job: dict):
+        """작업 목록/인덱스에 추가"""
+        self.jobs[job["job_id"]] = job
+        self._status_counts[job["status"]] += 1
+        if job["status"] in ACTIVE_STATUSES:
+            self._count_active_url(job["url"], 1)
+
+    def _set_job_status(self, job: dict, status: str):
+        """작업 상태 변경 (상태별 개수 함께 갱신, 실행 중 삭제된 작업은 개수에서 이미 빠졌으므로 제외)"""
+        if self.jobs.get(job["job_id"]) is job:
+            self._status_counts[job["status"]] -= 1
+            self._status_counts[status] += 1
+            was_active = job["status"] in ACTIVE_STATUSES
+            if was_active != (status in ACTIVE_STATUSES):
+                self._count_active_url(job["url"], -1 if was_active else 1)
+        job["status"] = status
+
+    def _count_active_url(self, url: str, delta: int):
+        """대기/실행 중인 URL 개수 갱신 (0이 되면 제거)"""
+        count = self._active_urls[url] + delta
+        if count > 0:
+            self._active_urls[url] = count
+        else:
+            self._active_urls.pop(url, None)
 
     def add_job(self, e):
         """새 작업 추가"""
@@ -1378,77 +1652,103 @@ class DubbingApp:
             self.show_toast("URL을 입력하세요", severity=ToastSeverity.WARNING)
             return
 
-        if any(j["url"] == url and j["status"] in ("pending", "running") for j in self.jobs):
+        if url in self._active_urls:
             self.show_toast("이미 대기 중인 작업입니다", severity=ToastSeverity.WARNING)
             return
 
         self.url_input.value = ""
-        self.page.update()
+        self.url_input.update()
+
+        # 같은 시각에 추가된 작업과 ID가 겹치면 번호를 붙임 (dict 키 덮어쓰기 방지, 시계 해상도가 낮은 OS 대비)
+        job_id = base_id = generate_job_id()
+        suffix = 1
+        while job_id in self.jobs:
+            job_id = f"{base_id}_{suffix}"
+            suffix += 1
+
+        # 영상 정보를 기다리지 않고 바로 카드를 표시, 정보는 백그라운드에서 채움
+        job = {
+            "job_id": job_id,
+            "url": url,
+            "output_dir": self.config.output_dir,
+            "status": "pending",
+            "progress": 0,
+            "current_step": "대기 중",
+            "messages": deque(maxlen=MAX_JOB_MESSAGES),
+            "error": None,
+            "result_files": [],
+            "created_at": time.time(),  # epoch 초 (정렬은 float 비교)
+            "video_info": {},
+            "source_lang": self.config.source_lang,
+        }
 
-        async def _add_with_info():
+        self._add_job_record(job)
+        self._request_refresh(job)
+        self.show_toast("작업이 추가되었습니다", severity=ToastSeverity.SUCCESS)
+        self.page.run_task(self._fetch_info_for, job, self._info_futures.pop(url, None))
+
+    def _prefetch_video_info(self, e=None):
+        """URL 입력란을 벗어날 때 영상 정보를 미리 가져오기 (추가 시점에 캐시 적중)"""
+        url = (self.url_input.value or "").strip()
+        # 입력란 URL이 바뀌었으면 추가되지 않은 이전 URL의 조회는 버림 (맵에 쌓이지 않도록)
+        for stale_url in [u for u in self._info_futures if u != url]:
+            self._info_futures.pop(stale_url).cancel()
+        if url and url not in self._info_futures and extract_video_id(url):
+            self._info_futures[url] = self._get_executor().submit(get_video_info, url)
+
+    async def _fetch_info_for(self, job: dict, prefetched: Future | None = None):
+        """작업의 영상 정보를 가져와 카드 갱신 (미리 가져온 결과가 있으면 재사용, 실패했으면 다시 조회)"""
+        url = job["url"]
+        video_info = None
+        if prefetched is not None:
             try:
-                self.show_toast("영상 정보 가져오는 중...", severity=ToastSeverity.INFORMATIONAL)
-                video_info = await asyncio.get_event_loop().run_in_executor(
-                    None, lambda: get_video_info(url)
-                )
+                video_info = await asyncio.wrap_future(prefetched)
+            except Exception:
+                pass
+        if video_info is None:
+            try:
+                video_info = await asyncio.wrap_future(self._get_executor().submit(get_video_info, url))
             except Exception:
                 video_info = {"title": "정보 로드 실패", "url": url, "available_subtitles": []}
 
-            # 자막 언어 결정: 기본 언어가 가용 목록에 있으면 사용, 없으면 첫 번째
-            available_subs = video_info.get("available_subtitles", [])
+        if job["job_id"] not in self.jobs:
+            return
+
+        # 자막 언어 결정: 기본 언어가 가용 목록에 있으면 사용, 없으면 첫 번째
+        available_subs = video_info.get("available_subtitles", [])
+        if available_subs and job["status"] == "pending":
             default_lang = self.config.source_lang
-            if available_subs:
-                if any(sub["lang"] == default_lang for sub in available_subs):
-                    selected_lang = default_lang
-                else:
-                    selected_lang = available_subs[0]["lang"]
-            else:
-                selected_lang = default_lang
-
-            job = {
-                "job_id": generate_job_id(),
-                "url": url,
-                "output_dir": self.config.output_dir,
-                "status": "pending",
-                "progress": 0,
-                "current_step": "대기 중",
-                "messages": [],
-                "error": None,
-                "result_files": [],
-                "created_at": datetime.now().isoformat(),
-                "video_info": video_info,
-                "source_lang": selected_lang,
-            }
-
-            self.jobs.append(job)
-            save_jobs(self.jobs)
-            self.refresh_jobs_list()
-            self.show_toast("작업이 추가되었습니다", severity=ToastSeverity.SUCCESS)
+            if not any(sub["lang"] == default_lang for sub in available_subs):
+                job["source_lang"] = available_subs[0]["lang"]
 
-        self.page.run_task(_add_with_info)
+        job["video_info"] = video_info
+        self._request_refresh(job)
 
     def delete_job(self, job: dict):
-        self.jobs = [j for j in self.jobs if j["job_id"] != job["job_id"]]
-        save_jobs(self.jobs)
-        self.refresh_jobs_list()
+        removed = self.jobs.pop(job["job_id"], None)
+        if removed is None:
+            return
+        self._status_counts[removed["status"]] -= 1
+        if removed["status"] in ACTIVE_STATUSES:
+            self._count_active_url(removed["url"], -1)
+        self._delete_jobs_soon([removed["job_id"]])
+        self._request_refresh()
 
     def retry_job(self, job: dict):
-        job["status"] = "pending"
+        self._set_job_status(job, "pending")
         job["progress"] = 0
         job["current_step"] = "대기 중"
         job["error"] = None
-        save_jobs(self.jobs)
-        self.refresh_jobs_list()
+        self._request_refresh(job)
 
     def pause_job(self, job: dict):
         """작업 일시 정지"""
         job_id = job.get("job_id")
         if job_id and job_id in self.pause_controllers:
             self.pause_controllers[job_id].pause()
-            job["status"] = "paused"
+            self._set_job_status(job, "paused")
             job["current_step"] = "일시 정지됨"
-            save_jobs(self.jobs)
-            self.refresh_jobs_list()
+            self._request_refresh(job)
             self.show_toast("작업 일시 정지됨", severity=ToastSeverity.WARNING)
 
     def resume_job(self, job: dict):
@@ -1456,10 +1756,9 @@ class DubbingApp:
         job_id = job.get("job_id")
         if job_id and job_id in self.pause_controllers:
             self.pause_controllers[job_id].resume()
-            job["status"] = "running"
+            self._set_job_status(job, "running")
             job["current_step"] = "재개됨..."
-            save_jobs(self.jobs)
-            self.refresh_jobs_list()
+            self._request_refresh(job)
             self.show_toast("작업 재개됨", severity=ToastSeverity.SUCCESS)
 
     def cancel_job(self, job: dict):
@@ -1467,87 +1766,131 @@ class DubbingApp:
         job_id = job.get("job_id")
         if job_id and job_id in self.pause_controllers:
             self.pause_controllers[job_id].cancel()
-            job["status"] = "cancelled"
+            self._set_job_status(job, "cancelled")
             job["current_step"] = "취소됨"
-            save_jobs(self.jobs)
-            self.refresh_jobs_list()
+            self._request_refresh(job)
             self.show_toast("작업 취소됨", severity=ToastSeverity.WARNING)
             # 컨트롤러 정리
             del self.pause_controllers[job_id]
 
     def change_subtitle_lang(self, job: dict):
         """자막 언어 변경"""
-        save_jobs(self.jobs)
+        save_job(job)
 
     def clear_completed(self, e):
-        self.jobs = [j for j in self.jobs if j["status"] not in ("completed", "error")]
-        save_jobs(self.jobs)
-        self.refresh_jobs_list()
+        if not (self._status_counts["completed"] or self._status_counts["error"]):
+            return
+        removed = [j["job_id"] for j in self.jobs.values() if j["status"] in ("completed", "error")]
+        for job_id in removed:
+            del self.jobs[job_id]
+        self._status_counts["completed"] = 0
+        self._status_counts["error"] = 0
+        self._delete_jobs_soon(removed)
+        self._request_refresh()
 
     def start_single_job(self, job: dict):
         if job["status"] != "pending":
             return
 
         async def _start():
-            if not self.worker_running:
-                self.page.run_task(self.job_worker)
-            await self.job_queue.put(job)
+            self._ensure_worker()
+            self.job_queue.put_nowait(job)
             self.show_toast("작업 시작", severity=ToastSeverity.INFORMATIONAL)
 
         self.page.run_task(_start)
 
     async def start_all_jobs(self):
-        pending_jobs = [j for j in self.jobs if j["status"] == "pending"]
-        if not pending_jobs:
+        if not self._status_counts["pending"]:
             self.show_toast("대기 중인 작업이 없습니다", severity=ToastSeverity.WARNING)
             return
 
+        pending_jobs = [j for j in self.jobs.values() if j["status"] == "pending"]
+
         self.show_toast(f"{len(pending_jobs)}개 작업 시작", severity=ToastSeverity.INFORMATIONAL)
 
-        if not self.worker_running:
-            self.page.run_task(self.job_worker)
+        self._ensure_worker()
 
+        # 큐 크기 제한이 없으므로 put_nowait로 한 번에 넣음 (작업마다 await하지 않음)
         for job in pending_jobs:
-            await self.job_queue.put(job)
+            self.job_queue.put_nowait(job)
 
-    async def job_worker(self):
-        self.worker_running = True
-
-        while True:
-            try:
-                job = await asyncio.wait_for(self.job_queue.get(), timeout=1.0)
-            except asyncio.TimeoutError:
-                if not any(j["status"] == "pending" for j in self.jobs):
-                    break
-                continue
+    def _ensure_worker(self):
+        """작업 워커를 config.max_workers개까지 시작 (여러 영상을 동시에 더빙)"""
+        while self._worker_count < self.config.max_workers:
+            self._worker_count += 1
+            self.page.run_task(self.job_worker)
 
-            await self.run_job(job)
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """더빙/영상 정보 조회용 스레드 풀 (작업 수 + 조회 여유분, shutdown 이후 다시 쓰면 새로 생성)"""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.config.max_workers + 2,
+                thread_name_prefix="dub",
+            )
+            atexit.register(self.executor.shutdown, wait=False)
+        return self.executor
 
-        self.worker_running = False
+    async def job_worker(self):
+        """작업 큐 소비 (None을 받으면 종료)"""
+        queue = self.job_queue  # shutdown 시 큐가 교체되므로 시작 시점의 큐를 계속 사용
+        try:
+            while True:
+                job = await queue.get()
+                if job is None:
+                    break
+                # 같은 작업이 두 번 큐에 들어가도 워커 하나만 실행 (run_job이 즉시 running으로 변경)
+                if job["status"] != "pending":
+                    continue
+                await self.run_job(job)
+        finally:
+            if queue is self.job_queue:
+                self._worker_count -= 1
+
+    async def shutdown(self, e=None):
+        """
+        세션 종료 시 작업 워커/스레드 풀 정리 + 미저장 작업 기록
+
+        기존 워커는 실행 중인 작업만 마치고 종료하며, 아직 시작하지 않은 작업은 대기 상태로 남김.
+        큐를 새로 만들고 워커 수를 0으로 돌려 재연결 후 시작한 작업은 새 워커가 처리함.
+        """
+        old_queue, self.job_queue = self.job_queue, asyncio.Queue()
+        while not old_queue.empty():
+            old_queue.get_nowait()
+        for _ in range(self._worker_count):
+            old_queue.put_nowait(None)
+        self._worker_count = 0
+
+        # 실행 중인 더빙은 스레드에서 끝까지 진행됨 (wait=False)
+        if self.executor is not None:
+            executor, self.executor = self.executor, None
+            executor.shutdown(wait=False)
+            atexit.unregister(executor.shutdown)
+        await self._flush_unsaved_jobs()
 
     async def run_job(self, job: dict):
-        job["status"] = "running"
+        self._set_job_status(job, "running")
         job["current_step"] = "시작 중..."
-        save_jobs(self.jobs)
-        self.refresh_jobs_list()
+        self._request_refresh(job, immediate=True)
 
         # PauseController 생성 및 저장
         job_id = job.get("job_id")
         pause_controller = PauseController()
         self.pause_controllers[job_id] = pause_controller
 
+        # 진행 메시지는 워커 스레드에서 큐에만 넣고, 작업 dict 변경은 이벤트 루프에서 (_drain_progress)
+        progress_queue: SimpleQueue[tuple[str, int]] = SimpleQueue()
+        self._progress_queues[job_id] = progress_queue
+
         def on_progress(msg: str, progress: int):
-            job["current_step"] = msg
-            job["progress"] = progress
-            job["messages"].append(msg)
-            self.page.run_task(self._update_job_ui)
+            progress_queue.put((msg, progress))
+            self._request_refresh(job)
 
         try:
             output_dir = Path(self.config.output_dir)
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            result = await asyncio.get_event_loop().run_in_executor(
-                None,
+            result = await self._loop.run_in_executor(
+                self._get_executor(),
                 lambda: run_dubbing(
                     url=job["url"],
                     output_dir=output_dir,
@@ -1558,7 +1901,8 @@ class DubbingApp:
                 ),
             )
 
-            job["status"] = result.status
+            self._drain_progress(job)
+            self._set_job_status(job, result.status)
             job["progress"] = result.progress
             job["error"] = result.error
             job["result_files"] = result.result_files
@@ -1572,65 +1916,64 @@ class DubbingApp:
                 self.show_toast("작업 취소됨", severity=ToastSeverity.WARNING)
 
         except Exception as e:
-            job["status"] = "error"
+            self._set_job_status(job, "error")
             job["error"] = str(e)
             self.show_toast(f"오류: {str(e)[:50]}", severity=ToastSeverity.CRITICAL)
 
-        # PauseController 정리
+        # PauseController, 진행 메시지 큐 정리
         if job_id in self.pause_controllers:
             del self.pause_controllers[job_id]
+        self._drain_progress(job)
+        self._progress_queues.pop(job_id, None)
 
-        save_jobs(self.jobs)
-        self.refresh_jobs_list()
-
-    async def _update_job_ui(self):
-        save_jobs(self.jobs)
-        self.refresh_jobs_list()
+        self._request_refresh(job, immediate=True)
 
     def show_theme_picker(self, e):
-        """테마 선택 다이얼로그"""
+        """테마 선택 다이얼로그 (한 번 만들어 재사용, 열 때마다 현재 테마 표시만 갱신)"""
+        if self._theme_dlg is None:
+            self._theme_dlg = self._build_theme_dialog()
+        dlg, options = self._theme_dlg
+        for name, (item, label, check) in options.items():
+            is_current = name == self.config.theme
+            label.weight = ft.FontWeight.W_600 if is_current else ft.FontWeight.NORMAL
+            check.visible = is_current
+            item.bgcolor = self.theme.surface if is_current else None
+        self.page.open(dlg)
+
+    def _build_theme_dialog(self) -> tuple[ft.AlertDialog, dict[str, tuple]]:
+        """테마 선택 다이얼로그 생성 (다이얼로그, 테마별 (항목, 이름, 체크 아이콘)) 반환"""
         theme = self.theme
 
-        theme_options = []
+        options = {}
         for name, t in THEMES.items():
-            is_current = name == self.config.theme
-            theme_options.append(
-                ft.Container(
-                    content=ft.Row(
-                        [
-                            ft.Container(
-                                width=24,
-                                height=24,
-                                bgcolor=t.primary,
-                                border_radius=12,
-                            ),
-                            ft.Text(
-                                t.display_name,
-                                color=theme.text_primary,
-                                weight=ft.FontWeight.W_600 if is_current else ft.FontWeight.NORMAL,
-                            ),
-                            ft.Icon(
-                                ft.Icons.CHECK,
-                                color=theme.accent,
-                                size=16,
-                            )
-                            if is_current
-                            else ft.Container(),
-                        ],
-                        spacing=12,
-                    ),
-                    padding=ft.padding.symmetric(horizontal=12, vertical=10),
-                    border_radius=8,
-                    bgcolor=theme.surface if is_current else None,
-                    on_click=lambda e, n=name: self._apply_theme(n),
-                    on_hover=lambda e: self._theme_item_hover(e),
-                )
+            label = ft.Text(t.display_name, color=theme.text_primary)
+            check = ft.Icon(ft.Icons.CHECK, color=theme.accent, size=16)
+            item = ft.Container(
+                content=ft.Row(
+                    [
+                        ft.Container(
+                            width=24,
+                            height=24,
+                            bgcolor=t.primary,
+                            border_radius=12,
+                        ),
+                        label,
+                        check,
+                    ],
+                    spacing=12,
+                ),
+                padding=ft.padding.symmetric(horizontal=12, vertical=10),
+                border_radius=8,
+                data=name,
+                on_click=lambda e, n=name: self._apply_theme(n),
+                on_hover=lambda e: self._theme_item_hover(e),
             )
+            options[name] = (item, label, check)
 
         dlg = ft.AlertDialog(
             title=ft.Text("테마 선택", color=theme.text_primary, weight=ft.FontWeight.BOLD),
             content=ft.Container(
-                content=ft.Column(theme_options, spacing=4),
+                content=ft.Column([item for item, _, _ in options.values()], spacing=4),
                 width=280,
                 padding=8,
             ),
@@ -1639,14 +1982,13 @@ class DubbingApp:
                 ft.TextButton("닫기", on_click=lambda e: self.page.close(dlg)),
             ],
         )
-
-        self.page.open(dlg)
+        return dlg, options
 
     def _theme_item_hover(self, e):
         if e.data == "true":
             e.control.bgcolor = self.theme.surface
         else:
-            if self.config.theme not in str(e.control.content):
+            if e.control.data != self.config.theme:
                 e.control.bgcolor = None
         e.control.update()
 
@@ -1655,11 +1997,22 @@ class DubbingApp:
         self.config.theme = theme_name
         save_config(self.config)
         self.theme = get_theme(theme_name)
+        # 다이얼로그는 테마 색상을 들고 있으므로 다음에 열 때 새로 생성
+        self._theme_dlg = None
+        self._settings_dlg = None
+
+        # 기존 컨트롤은 그대로 두고 색상만 교체 (apply_theme의 page.update()로 한 번에 반영)
+        for apply in self._theme_consumers:
+            apply(self.theme)
         apply_theme(self.page, self.theme)
 
-        # UI 다시 빌드
-        self.page.controls.clear()
-        self.build_ui()
+        # 카드와 빈 목록 안내는 테마 색상을 들고 있으므로 새로 생성해 다시 배치
+        self._theme_generation += 1
+        self._job_cards.clear()
+        self._last_pending_ids = None
+        self._last_completed_ids = None
+        self._last_fingerprint = None
+        self._request_refresh(immediate=True)
         self.show_toast(f"테마: {self.theme.display_name}", severity=ToastSeverity.SUCCESS)
 
     def show_about(self, e):
@@ -1671,7 +2024,7 @@ class DubbingApp:
             self.page.update()
 
         def open_github(e):
-            subprocess.run(["open", "https://github.com/frentis-ai-study/youtube-dubbing-app"])
+            open_external("https://github.com/frentis-ai-study/youtube-dubbing-app")
 
         dialog = ft.AlertDialog(
             modal=True,
@@ -1712,17 +2065,19 @@ class DubbingApp:
         self.page.update()
 
     def show_settings(self, e):
-        """설정 다이얼로그"""
-        theme = self.theme
-        is_ollama = "localhost:11434" in self.config.zai_base_url
+        """설정 다이얼로그 (한 번 만들어 재사용, 열 때마다 현재 설정 값으로 채움)"""
+        if self._settings_dlg is None:
+            self._settings_dlg = self._build_settings_dialog()
+        dlg, load_values = self._settings_dlg
+        load_values()
+        self.page.open(dlg)
 
-        if is_ollama and not self.ollama_models:
-            self.ollama_models = get_ollama_models()
+    def _build_settings_dialog(self) -> tuple[ft.AlertDialog, Callable[[], None]]:
+        """설정 다이얼로그 생성 (다이얼로그, 값 채우기 함수) 반환"""
+        theme = self.theme
 
         api_key_field = ft.TextField(
             label="API 키",
-            value=self.config.zai_api_key,
-            password=not is_ollama,
             width=380,
             border_color=theme.border,
             focused_border_color=theme.accent,
@@ -1733,7 +2088,6 @@ class DubbingApp:
 
         base_url_field = ft.TextField(
             label="API URL",
-            value=self.config.zai_base_url,
             width=380,
             border_color=theme.border,
             focused_border_color=theme.accent,
@@ -1744,43 +2098,45 @@ class DubbingApp:
 
         # 모델 필드를 담을 컨테이너 (동적 교체용)
         model_container = ft.Container()
+        model_dropdown: ft.Dropdown | None = None
+        model_dropdown_key: int | None = None  # 드롭다운 옵션을 만든 모델 목록의 해시
 
-        def create_ollama_model_dropdown(models: list[str], current_value: str = None):
-            """Ollama 모델 드롭다운 생성"""
-            value = current_value if current_value in models else (models[0] if models else "gemma3:latest")
-            return ft.Dropdown(
-                label="모델",
-                value=value,
-                options=[ft.dropdown.Option(m) for m in models],
-                width=380,
-                border_color=theme.border,
-                focused_border_color=theme.accent,
-                label_style=ft.TextStyle(color=theme.text_secondary),
-                text_style=ft.TextStyle(color=theme.text_primary),
-            )
+        text_model_field = ft.TextField(
+            label="모델",
+            width=380,
+            border_color=theme.border,
+            focused_border_color=theme.accent,
+            label_style=ft.TextStyle(color=theme.text_secondary),
+            text_style=ft.TextStyle(color=theme.text_primary),
+            cursor_color=theme.accent,
+        )
 
-        def create_text_model_field(value: str):
-            """텍스트 모델 필드 생성"""
-            return ft.TextField(
-                label="모델",
-                value=value,
-                width=380,
-                border_color=theme.border,
-                focused_border_color=theme.accent,
-                label_style=ft.TextStyle(color=theme.text_secondary),
-                text_style=ft.TextStyle(color=theme.text_primary),
-                cursor_color=theme.accent,
-            )
+        def show_ollama_model_dropdown(current_value: str = None):
+            """Ollama 모델 드롭다운 표시 (모델 목록이 바뀐 경우에만 옵션 재생성)"""
+            nonlocal model_dropdown, model_dropdown_key
+            models = self.ollama_models
+            key = hash(tuple(models))
+            if model_dropdown is None or key != model_dropdown_key:
+                model_dropdown = ft.Dropdown(
+                    label="모델",
+                    options=[ft.dropdown.Option(m) for m in models],
+                    width=380,
+                    border_color=theme.border,
+                    focused_border_color=theme.accent,
+                    label_style=ft.TextStyle(color=theme.text_secondary),
+                    text_style=ft.TextStyle(color=theme.text_primary),
+                )
+                model_dropdown_key = key
+            model_dropdown.value = current_value if current_value in models else (models[0] if models else "gemma3:latest")
+            model_container.content = model_dropdown
 
-        # 초기 모델 필드 설정
-        if is_ollama and self.ollama_models:
-            model_container.content = create_ollama_model_dropdown(self.ollama_models, self.config.zai_model)
-        else:
-            model_container.content = create_text_model_field(self.config.zai_model)
+        def show_text_model_field(value: str):
+            """텍스트 모델 필드 표시"""
+            text_model_field.value = value
+            model_container.content = text_model_field
 
         output_dir_field = ft.TextField(
             label="출력 디렉토리",
-            value=self.config.output_dir,
             width=380,
             border_color=theme.border,
             focused_border_color=theme.accent,
@@ -1792,7 +2148,6 @@ class DubbingApp:
         voice_options = list(KOREAN_VOICES.keys())
         voice_field = ft.Dropdown(
             label="TTS 음성",
-            value=self.config.tts_voice if self.config.tts_voice in voice_options else voice_options[0],
             options=[ft.dropdown.Option(v, f"{v} ({KOREAN_VOICES[v]['gender']})") for v in voice_options],
             width=380,
             border_color=theme.border,
@@ -1801,12 +2156,28 @@ class DubbingApp:
             text_style=ft.TextStyle(color=theme.text_primary),
         )
 
+        def load_values():
+            """현재 설정 값으로 필드 채우기"""
+            is_ollama = "localhost:11434" in self.config.zai_base_url
+            if is_ollama and not self.ollama_models:
+                self.ollama_models = get_ollama_models()
+
+            api_key_field.value = self.config.zai_api_key
+            api_key_field.password = not is_ollama
+            base_url_field.value = self.config.zai_base_url
+            if is_ollama and self.ollama_models:
+                show_ollama_model_dropdown(self.config.zai_model)
+            else:
+                show_text_model_field(self.config.zai_model)
+            output_dir_field.value = self.config.output_dir
+            voice_field.value = self.config.tts_voice if self.config.tts_voice in voice_options else voice_options[0]
+
         def use_zai(e):
             base_url_field.value = PRESETS["z.ai"]["base_url"]
             api_key_field.password = True
             api_key_field.value = ""
             # z.ai는 텍스트 필드로 모델 입력
-            model_container.content = create_text_model_field(PRESETS["z.ai"]["default_model"])
+            show_text_model_field(PRESETS["z.ai"]["default_model"])
             self.page.update()
 
         def use_ollama(e):
@@ -1816,9 +2187,9 @@ class DubbingApp:
             # Ollama 모델 목록 갱신 후 드롭다운으로 교체
             self.ollama_models = get_ollama_models()
             if self.ollama_models:
-                model_container.content = create_ollama_model_dropdown(self.ollama_models)
+                show_ollama_model_dropdown()
             else:
-                model_container.content = create_text_model_field("gemma3:latest")
+                show_text_model_field("gemma3:latest")
             self.page.update()
 
         def save_settings(e):
@@ -1876,17 +2247,11 @@ class DubbingApp:
             ],
         )
 
-        self.page.open(dlg)
+        return dlg, load_values
 
     def show_toast(self, message: str, severity: str = ToastSeverity.INFORMATIONAL):
         """Toast 알림 표시 (SnackBar 사용)"""
-        colors = {
-            ToastSeverity.INFORMATIONAL: self.theme.info,
-            ToastSeverity.SUCCESS: self.theme.success,
-            ToastSeverity.WARNING: self.theme.warning,
-            ToastSeverity.CRITICAL: self.theme.error,
-        }
-        bgcolor = colors.get(severity, self.theme.info)
+        bgcolor = getattr(self.theme, self.TOAST_COLOR_FIELDS.get(severity, "info"))
 
         self.page.open(
             ft.SnackBar(
@@ -1899,6 +2264,9 @@ class DubbingApp:
 
 async def main(page: ft.Page):
     """메인 함수"""
+    # Python 3.12+: 첫 await 전에 끝나는 코루틴은 스케줄러를 거치지 않고 바로 실행
+    if sys.version_info >= (3, 12):
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     DubbingApp(page)
 
 
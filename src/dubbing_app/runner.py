@@ -1,6 +1,11 @@
 """더빙 파이프라인 실행"""
 
+import json
+import os
+import shutil
 import threading
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -64,7 +69,11 @@ from dubbing_app.core.translator import translate_full_text, check_ollama_status
 from dubbing_app.core.tts import generate_tts
 
 
-@dataclass
+MAX_MESSAGES = 500  # 작업별로 유지할 진행 메시지 수
+CHUNK_TRASH_PREFIX = ".chunks-trash-"  # 삭제 대기 중인 청크 폴더 이름 앞부분
+
+
+@dataclass(slots=True)
 class DubbingJob:
     """더빙 작업 정보"""
     job_id: str
@@ -73,7 +82,7 @@ class DubbingJob:
     status: str = "pending"  # pending, running, paused, completed, error, cancelled
     progress: int = 0
     current_step: str = ""
-    messages: list[str] = field(default_factory=list)
+    messages: deque[str] = field(default_factory=lambda: deque(maxlen=MAX_MESSAGES))  # 최근 진행 메시지만 유지
     error: str | None = None
     result_files: list[str] = field(default_factory=list)
     created_at: datetime = field(default_factory=datetime.now)
@@ -81,8 +90,45 @@ class DubbingJob:
 
 
 def generate_job_id() -> str:
-    """고유한 작업 ID 생성"""
-    return datetime.now().strftime("%Y%m%d_%H%M%S_%f")[:20]
+    """고유한 작업 ID 생성 (YYYYMMDD_HHMMSS_ffffff, datetime 객체 생성 없이 계산)"""
+    ns = time.time_ns()
+    lt = time.localtime(ns // 1_000_000_000)
+    us = (ns // 1000) % 1_000_000
+    return (
+        f"{lt.tm_year:04d}{lt.tm_mon:02d}{lt.tm_mday:02d}_"
+        f"{lt.tm_hour:02d}{lt.tm_min:02d}{lt.tm_sec:02d}_{us:06d}"
+    )
+
+
+def _write_bytes(path: Path, data: bytes) -> None:
+    """파일에 바이트를 그대로 쓰기 (텍스트 모드 인코딩/버퍼 계층 없이 os.write)"""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def _remove_dir_in_background(path: Path) -> None:
+    """폴더를 백그라운드 스레드에서 삭제 (끝나기 전에 프로세스가 종료되면 다음 실행 때 _sweep_chunk_trash가 정리)"""
+    threading.Thread(
+        target=shutil.rmtree, args=(path,), kwargs={"ignore_errors": True}, daemon=True
+    ).start()
+
+
+def _sweep_chunk_trash(folder: Path) -> None:
+    """이전 실행에서 다 지우지 못한 청크 폴더 정리"""
+    try:
+        with os.scandir(folder) as entries:
+            leftovers = [
+                entry.path for entry in entries if entry.name.startswith(CHUNK_TRASH_PREFIX) and entry.is_dir()
+            ]
+    except OSError:
+        return
+    for path in leftovers:
+        _remove_dir_in_background(Path(path))
 
 
 def run_dubbing(
@@ -159,12 +205,11 @@ def run_dubbing(
         if not video_id:
             raise Exception("유효하지 않은 YouTube URL입니다.")
 
-        video_info = get_video_info(url)
-        title = sanitize_filename(video_info["title"])
-        log(f"제목: {title} (ID: {video_id})", 10)
-
-        # 기존 출력 확인 (단계별 재개 지원)
+        # 기존 출력 확인 (단계별 재개 지원) - 영상 정보 조회보다 먼저 수행해
+        # 완료/재개 작업은 yt-dlp 메타데이터 조회를 건너뜀
         existing = check_existing_output(output_dir, video_id)
+        if existing:
+            _sweep_chunk_trash(existing["folder"])
 
         if existing and existing["resume_from"] == "done":
             log("이미 완료된 작업입니다. 스킵합니다.", 100)
@@ -179,18 +224,22 @@ def run_dubbing(
             job.current_step = "이미 완료됨 (스킵)"
             return job
 
-        # 출력 폴더 생성/재사용
+        # 출력 폴더 생성/재사용 (폴더 이름이 "{video_id}-{title}" 형식이므로 제목 재사용)
         if existing:
             job_output_dir = existing["folder"]
+            title = job_output_dir.name[len(video_id) + 1 :]
+            log(f"제목: {title} (ID: {video_id})", 10)
             resume_from = existing["resume_from"]
             log(f"기존 작업 재개: {resume_from} 단계부터", 15)
         else:
+            video_info = get_video_info(url)
+            title = sanitize_filename(video_info["title"])
+            log(f"제목: {title} (ID: {video_id})", 10)
             job_output_dir = output_dir / f"{video_id}-{title}"
             job_output_dir.mkdir(parents=True, exist_ok=True)
             resume_from = "start"
 
         # Step 2: 자막 추출 (또는 기존 파일 사용)
-        import json
         segments_file = job_output_dir / "segments.json"
 
         if resume_from == "start":
@@ -206,19 +255,19 @@ def run_dubbing(
 
             # 원본 자막 저장
             original_file = job_output_dir / "transcript_original.txt"
-            original_file.write_text(original_text, encoding="utf-8")
+            _write_bytes(original_file, original_text.encode("utf-8"))
             job.result_files.append(str(original_file))
 
             # 세그먼트 정보 저장 (재개 시 동일 청킹 유지용)
             if segments:
-                segments_file.write_text(json.dumps(segments, ensure_ascii=False), encoding="utf-8")
+                _write_bytes(segments_file, json.dumps(segments, ensure_ascii=False).encode("utf-8"))
         else:
             # 기존 원본 자막 사용
             log("기존 자막 파일 사용", 30)
             original_text = existing["original_text"]
 
             # 세그먼트 파일이 있으면 로드 (동일 청킹 유지)
-            if segments_file.exists():
+            if existing["has_segments"]:
                 segments = json.loads(segments_file.read_text(encoding="utf-8"))
                 log(f"세그먼트 정보 로드 ({len(segments)}개)", 32)
             else:
@@ -260,14 +309,19 @@ def run_dubbing(
 
             # 번역 자막 저장
             korean_file = job_output_dir / "transcript_korean.txt"
-            korean_file.write_text(korean_text, encoding="utf-8")
+            _write_bytes(korean_file, korean_text.encode("utf-8"))
             job.result_files.append(str(korean_file))
 
             # 번역 완료 후 chunks 폴더 삭제 (더 이상 필요 없음)
+            # 이름만 바로 바꾸고 실제 삭제는 백그라운드 스레드에서 (TTS 시작을 지연시키지 않음)
             if chunks_dir.exists():
-                import shutil
-                shutil.rmtree(chunks_dir)
-                log("임시 청크 파일 정리 완료", 72)
+                trash_dir = chunks_dir.with_name(f"{CHUNK_TRASH_PREFIX}{os.getpid()}-{time.monotonic_ns()}")
+                try:
+                    chunks_dir.rename(trash_dir)
+                except OSError:
+                    trash_dir = chunks_dir
+                _remove_dir_in_background(trash_dir)
+                log("임시 청크 파일 정리 예약됨", 72)
         else:
             # 기존 번역 파일 사용
             log("기존 번역 파일 사용", 70)
@@ -311,19 +365,28 @@ def run_dubbing(
     return job
 
 
+RESULT_SUFFIXES = (".mp3", "_korean.txt", "_original.txt")  # 결과 파일로 취급할 이름 끝부분
+
+
 def find_result_files(output_dir: Path) -> list[str]:
     """출력 디렉토리에서 결과 파일 찾기"""
-    result_files = []
-
     if not output_dir.exists():
-        return result_files
-
-    # 최신 폴더 찾기 (날짜 형식)
-    subdirs = sorted(output_dir.iterdir(), reverse=True)
-    for subdir in subdirs:
-        if subdir.is_dir() and subdir.name[0].isdigit():
-            for pattern in ["*.mp3", "*_korean.txt", "*_original.txt"]:
-                result_files.extend(str(f) for f in subdir.glob(pattern))
-            break
+        return []
+
+    # 최신 폴더 찾기 (날짜 형식): 전체를 정렬하지 않고 한 번 훑으며 이름이 가장 큰 폴더 선택
+    newest = None
+    with os.scandir(output_dir) as entries:
+        for entry in entries:
+            if entry.name[0].isdigit() and (newest is None or entry.name > newest.name) and entry.is_dir():
+                newest = entry
+    subdir = Path(newest.path) if newest is not None else None
+
+    # 결과 파일: 패턴별 glob 대신 폴더를 한 번만 읽어 이름 끝부분으로 판별
+    result_files = []
+    if subdir is not None:
+        with os.scandir(subdir) as entries:
+            result_files = [
+                entry.path for entry in entries if entry.name.endswith(RESULT_SUFFIXES) and entry.is_file()
+            ]
 
     return result_files